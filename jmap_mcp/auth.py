@@ -1,44 +1,136 @@
 """Simple authentication wrapper for JMAP using jmapc library."""
 
+import asyncio
+import atexit
+import hashlib
 import logging
-from typing import Optional
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 from jmapc import Client
+from jmapc.session import Session
 
 from jmap_mcp.config import config
 
 logger = logging.getLogger(__name__)
 
+# The JMAP session document (account id, API URLs, capabilities) is cached
+# on disk so a fresh process can skip the .well-known/jmap round-trip
+if os.name == "nt":  # Windows
+    SESSION_CACHE_DIR = Path.home() / "AppData" / "Local" / "jmap-mcp" / "cache"
+else:  # Unix-like (including macOS)
+    SESSION_CACHE_DIR = Path.home() / ".cache" / "jmap-mcp"
+SESSION_CACHE_TTL = 24 * 60 * 60  # 24 hours
+
+# jmapc clients keyed by (host, token). Each client owns a requests session
+# (HTTP connection pool) and the cached JMAP session document, so sharing
+# them avoids a new TLS handshake and session discovery per tool call.
+_shared_clients: Dict[Tuple[str, str], Client] = {}
+# Clients are built in worker threads, so the lookup and insert are guarded
+# to stop concurrent callers each building (and orphaning) a client
+_shared_clients_lock = threading.Lock()
+# Last session written to (or read from) disk for each client key
+_persisted_sessions: Dict[Tuple[str, str], Session] = {}
+
+
+def _session_cache_path(host: str, api_token: str) -> Path:
+    """Get the session cache file for a host and token."""
+    digest = hashlib.sha256(f"{host}\0{api_token}".encode()).hexdigest()[:16]
+    return SESSION_CACHE_DIR / f"session-{digest}.json"
+
+
+def _load_cached_session(host: str, api_token: str) -> Optional[Session]:
+    """Load a cached JMAP session if one exists and has not expired."""
+    path = _session_cache_path(host, api_token)
+    try:
+        if time.time() - path.stat().st_mtime > SESSION_CACHE_TTL:
+            return None
+        return Session.from_json(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug("Ignoring unreadable session cache %s: %s", path, e)
+        return None
+
+
+def _get_shared_client(host: str, api_token: str) -> Client:
+    """Get the process-wide jmapc client for a host and token."""
+    key = (host, api_token)
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = Client.create_with_api_token(host=host, api_token=api_token)
+            session = _load_cached_session(host, api_token)
+            if session is not None:
+                # Prime jmapc's cached_property so no discovery request is made
+                client.jmap_session = session
+                _persisted_sessions[key] = session
+            _shared_clients[key] = client
+        return client
+
+
+@atexit.register
+def _close_shared_clients() -> None:
+    """Close pooled HTTP connections on interpreter shutdown."""
+    for client in _shared_clients.values():
+        # requests_session is a cached_property; only close it if created
+        session = client.__dict__.get("requests_session")
+        if session is not None:
+            session.close()
+    _shared_clients.clear()
+
 
 class FastmailAuth:
     """Simple wrapper around jmapc Client for authentication."""
 
     def __init__(self):
         self.auth_token: str = config.fastmail.auth_token
-        self.jmap_host: str = self._extract_host_from_url(config.fastmail.jmap_base_url)
+        self.jmap_host: str = config.fastmail.jmap_host
         self._client: Optional[Client] = None
 
-    def _extract_host_from_url(self, url: str) -> str:
-        """Extract host from JMAP base URL."""
-        # Remove protocol and path, keep just the host
-        if "://" in url:
-            url = url.split("://")[1]
-        if "/" in url:
-            url = url.split("/")[0]
-        return url
-
     async def __aenter__(self):
-        """Create jmapc client."""
-        self._client = Client.create_with_api_token(
-            host=self.jmap_host, api_token=self.auth_token
+        """Attach the shared jmapc client."""
+        # The first call for a key reads the session cache file from disk
+        self._client = await asyncio.to_thread(
+            _get_shared_client, self.jmap_host, self.auth_token
         )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Cleanup jmapc client."""
+        """Release the jmapc client.
+
+        The underlying client is shared and stays open for reuse; its
+        connections are closed at interpreter shutdown.
+        """
+
+    def save_session(self) -> None:
+        """Write the client's JMAP session to disk if it has changed."""
+        if not self._client:
+            return
+        key = (self.jmap_host, self.auth_token)
+        # jmapc fetches the session lazily and drops it when its state changes
+        session = self._client.__dict__.get("jmap_session")
+        if session is None or _persisted_sessions.get(key) is session:
+            return
+
+        path = _session_cache_path(self.jmap_host, self.auth_token)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch(mode=0o600)
+            path.write_text(session.to_json(), encoding="utf-8")
+            _persisted_sessions[key] = session
+        except OSError as e:
+            logger.warning("Failed to write session cache %s: %s", path, e)
+
+    def invalidate_session(self) -> None:
+        """Forget the cached JMAP session in memory and on disk."""
+        _persisted_sessions.pop((self.jmap_host, self.auth_token), None)
         if self._client:
-            # jmapc handles cleanup automatically
-            pass
+            self._client.__dict__.pop("jmap_session", None)
+        _session_cache_path(self.jmap_host, self.auth_token).unlink(missing_ok=True)
 
     def get_client(self) -> Client:
         """Get the jmapc client instance."""
@@ -1,27 +1,43 @@
 import os
+from dataclasses import dataclass, field
 from typing import Optional
-from pydantic import BaseModel, Field
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
-class FastmailConfig(BaseModel):
+def _extract_host_from_url(url: str) -> str:
+    """Extract host (and port, if any) from JMAP base URL."""
+    # Bare hosts have no scheme; prefix "//" so urlsplit treats them as netloc
+    return urlsplit(url if "://" in url else "//" + url).netloc or url
+
+
+@dataclass(slots=True, frozen=True)
+class FastmailConfig:
     """Fastmail API configuration."""
 
-    auth_token: str = Field(..., description="Fastmail API auth token")
+    # Fastmail API auth token
+    auth_token: str
 
     # Fastmail JMAP API endpoints
-    jmap_base_url: str = Field(
-        default="https://api.fastmail.com/jmap/api/", description="JMAP API base URL"
-    )
+    jmap_base_url: str = "https://api.fastmail.com/jmap/api/"
+
+    # JMAP host derived from the base URL, parsed once per config
+    jmap_host: str = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "jmap_host", _extract_host_from_url(self.jmap_base_url)
+        )
 
 
-class MCPConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class MCPConfig:
     """MCP server configuration."""
 
-    host: str = Field(default="localhost", description="MCP server host")
-    port: int = Field(default=3000, description="MCP server port")
+    host: str = "localhost"
+    port: int = 3000
 
 
 class Config:
@@ -1,24 +1,33 @@
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import operator
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 from jmapc import (
     Client,
     EmailQueryFilterCondition,
+    EmailQueryFilterOperator,
     MailboxQueryFilterCondition,
     Comparator,
     Ref,
-    Address,
     Email,
     EmailAddress,
     EmailBodyPart,
     EmailBodyValue,
     EmailSubmission,
-    Envelope,
+    Identity,
+    Operator,
 )
 from jmapc.methods import (
+    MailboxChanges,
+    MailboxChangesResponse,
     MailboxGet,
     MailboxGetResponse,
     MailboxQuery,
+    MailboxQueryResponse,
     EmailGet,
     EmailGetResponse,
     EmailQuery,
@@ -34,6 +43,201 @@ from .config import config
 
 logger = logging.getLogger(__name__)
 
+# Email/get ids per request, kept under typical server maxObjectsInGet limits
+EMAIL_GET_CHUNK_SIZE = 50
+# RFC 8620 recommends servers allow at least 4 concurrent requests
+MAX_CONCURRENT_REQUESTS = 4
+# Seconds a fetched mailbox list is served without asking the server
+# whether its Mailbox state has moved on
+MAILBOX_CACHE_TTL = 60
+
+# Default Email/get properties for listings; body fields dominate the
+# response size, so they are only requested when the caller asks for them
+LIST_PROPERTIES = (
+    "id",
+    "subject",
+    "from",
+    "to",
+    "receivedAt",
+    "size",
+    "preview",
+    "keywords",
+)
+FULL_PROPERTIES = (
+    "id",
+    "subject",
+    "from",
+    "to",
+    "cc",
+    "bcc",
+    "receivedAt",
+    "size",
+    "preview",
+    "bodyStructure",
+    "textBody",
+    "htmlBody",
+)
+
+# Mailbox/get properties; the id is always returned, and these are the only
+# other fields copied into the mailbox dicts
+MAILBOX_PROPERTIES = ("name", "role", "totalEmails", "unreadEmails")
+
+# search_emails filter keys -> EmailQueryFilterCondition fields
+_FILTER_KEY_MAP = {
+    "text": "text",
+    "from": "mail_from",
+    "to": "to",
+    "cc": "cc",
+    "bcc": "bcc",
+    "body": "body",
+    "header": "header",
+    "before": "before",
+    "after": "after",
+    "min_size": "min_size",
+    "max_size": "max_size",
+    "has_keyword": "has_keyword",
+    "not_keyword": "not_keyword",
+    "has_attachment": "has_attachment",
+}
+_DATE_FILTER_KEYS = ("before", "after")
+# EmailQueryFilterCondition has no subject field, so a subject search is
+# sent as the equivalent header condition
+_SUBJECT_HEADER = "Subject"
+
+_DEFAULT_SORT = (Comparator(property="receivedAt", is_ascending=False),)
+
+_address_fields = operator.attrgetter("email", "name")
+
+
+def _addresses(addrs: Optional[List[Any]]) -> List[Dict[str, str]]:
+    """Convert jmapc EmailAddress objects to plain dicts."""
+    if not addrs:
+        return []
+    return [
+        {"email": email, "name": name or ""}
+        for email, name in map(_address_fields, addrs)
+    ]
+
+
+def _parse_datetime(value: Union[datetime, str]) -> datetime:
+    """Accept a datetime or an ISO 8601 string for date filters."""
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+@dataclass(slots=True)
+class MailboxCache:
+    """Mailbox list from one Mailbox/get, tagged with its state string."""
+
+    state: str
+    mailboxes: List[Dict[str, Any]]
+    by_id: Dict[str, Dict[str, Any]] = field(init=False)
+    by_name_lower: Dict[str, Dict[str, Any]] = field(init=False)
+    by_role: Dict[str, Dict[str, Any]] = field(init=False)
+    checked_at: float = field(default_factory=time.monotonic)
+
+    def __post_init__(self):
+        self.by_id = {mailbox["id"]: mailbox for mailbox in self.mailboxes}
+        # setdefault keeps the first mailbox when names collide
+        self.by_name_lower = {}
+        self.by_role = {}
+        for mailbox in self.mailboxes:
+            if mailbox.get("name"):
+                self.by_name_lower.setdefault(mailbox["name"].lower(), mailbox)
+            if mailbox.get("role"):
+                self.by_role.setdefault(mailbox["role"], mailbox)
+
+    def find(self, name: str) -> Optional[Dict[str, Any]]:
+        """Find a mailbox by case-insensitive name, falling back to role."""
+        target = name.lower()
+        return self.by_name_lower.get(target) or self.by_role.get(target)
+
+    def is_fresh(self) -> bool:
+        """Whether the list is recent enough to use without revalidating."""
+        return time.monotonic() - self.checked_at < MAILBOX_CACHE_TTL
+
+
+def _email_query(
+    filter_conditions: Optional[Dict[str, Any]],
+    sort: Optional[List[Dict[str, str]]],
+    limit: Optional[int],
+    mailbox_id: Optional[str],
+) -> EmailQuery:
+    """Build an Email/query call from search_emails-style arguments."""
+    # Build filter using jmapc's EmailQueryFilterCondition. All conditions
+    # go into a single FilterCondition, which the server evaluates as an AND.
+    filter_kwargs = {}
+    if filter_conditions:
+        filter_kwargs = {
+            dst: filter_conditions[src]
+            for src, dst in _FILTER_KEY_MAP.items()
+            if src in filter_conditions
+        }
+        for key in _DATE_FILTER_KEYS:
+            if key in filter_kwargs:
+                filter_kwargs[key] = _parse_datetime(filter_kwargs[key])
+
+    if mailbox_id:
+        filter_kwargs["in_mailbox"] = mailbox_id
+
+    subject_filter = None
+    if filter_conditions and filter_conditions.get("subject"):
+        subject_header = [_SUBJECT_HEADER, filter_conditions["subject"]]
+        if "header" in filter_kwargs:
+            # One condition holds one header test, so AND in a second
+            subject_filter = EmailQueryFilterCondition(header=subject_header)
+        else:
+            filter_kwargs["header"] = subject_header
+
+    # Build sort using jmapc's Comparator
+    sort_comparators = _DEFAULT_SORT
+    if sort:
+        sort_comparators = [
+            Comparator(
+                property=sort_item.get("property", "receivedAt"),
+                is_ascending=sort_item.get("isAscending", False),
+            )
+            for sort_item in sort
+        ]
+
+    email_filter = EmailQueryFilterCondition(**filter_kwargs) if filter_kwargs else None
+    if subject_filter is not None:
+        email_filter = EmailQueryFilterOperator(
+            operator=Operator.AND, conditions=[email_filter, subject_filter]
+        )
+    return EmailQuery(filter=email_filter, sort=sort_comparators, limit=limit or 50)
+
+
+# Email/get property -> converter for the dicts handed to the MCP tools.
+# Only requested properties are copied, so an absent key means "not
+# fetched" rather than "empty".
+_EMAIL_FIELDS = {
+    "subject": lambda email: email.subject,
+    "from": lambda email: _addresses(email.mail_from),
+    "to": lambda email: _addresses(email.to),
+    "cc": lambda email: _addresses(email.cc),
+    "bcc": lambda email: _addresses(email.bcc),
+    "receivedAt": lambda email: email.received_at,
+    "sentAt": lambda email: email.sent_at,
+    "size": lambda email: email.size or 0,
+    "preview": lambda email: email.preview or "",
+    # JMAP keywords are a String[Boolean] map, so membership is a dict lookup
+    "keywords": lambda email: email.keywords or {},
+    "textBody": lambda email: email.text_body or [],
+    "htmlBody": lambda email: email.html_body or [],
+}
+
+
+def _email_to_dict(email: Email, properties: Sequence[str]) -> Dict[str, Any]:
+    """Convert a jmapc Email to the format expected by the MCP tools."""
+    email_dict = {"id": email.id}
+    for prop in properties:
+        convert = _EMAIL_FIELDS.get(prop)
+        if convert is not None:
+            email_dict[prop] = convert(email)
+    return email_dict
+
 
 class JMAPError(Exception):
     """JMAP API error."""
@@ -50,6 +254,17 @@ class JMAPClient:
     def __init__(self):
         self._auth = FastmailAuth()
         self._client: Optional[Client] = None
+        # Drafts mailbox and primary identity are stable for the session,
+        # so they are resolved once and reused for later drafts and sends
+        self._drafts_mailbox_id: Optional[str] = None
+        self._identity: Optional[Identity] = None
+        self._mailboxes: Optional[MailboxCache] = None
+        # Held while the cache is checked or refilled, so concurrent callers
+        # wait for one fetch instead of each starting their own
+        self._mailbox_lock = asyncio.Lock()
+        # Shared by every request from this client, so concurrent tool calls
+        # and chunked fetches together stay within the server's limit
+        self._request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
     async def __aenter__(self):
         await self._auth.__aenter__()
@@ -59,17 +274,60 @@ class JMAPClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self._auth.__aexit__(exc_type, exc_val, exc_tb)
 
+    async def _request(self, calls: List[Any]) -> Any:
+        """Run a jmapc request off the event loop.
+
+        jmapc is synchronous, so requests run in a worker thread to let
+        concurrent tool calls overlap their network round-trips. The
+        session cache file is written or removed in the same thread.
+        """
+        try:
+            async with self._request_slots:
+                return await asyncio.to_thread(self._request_sync, calls)
+        except Exception as e:
+            # A rejected token may mean the cached session is stale
+            if getattr(getattr(e, "response", None), "status_code", None) == 401:
+                await asyncio.to_thread(self._auth.invalidate_session)
+            raise
+
+    def _request_sync(self, calls: List[Any]) -> Any:
+        """Send a jmapc request and persist the session it used."""
+        results = self._client.request(calls)
+        self._auth.save_session()
+        return results
+
     async def get_mailboxes(self) -> List[Dict[str, Any]]:
-        """Get list of mailboxes."""
+        """Get list of mailboxes.
+
+        The list is cached. Once MAILBOX_CACHE_TTL has passed, a
+        Mailbox/changes call checks whether anything (including email
+        counts) changed, and the list is only fetched again if it did.
+        """
+        return (await self.get_mailbox_cache()).mailboxes
+
+    async def get_mailbox_cache(self) -> MailboxCache:
+        """Get the cached mailboxes, revalidating or refetching as needed."""
         if not self._client:
             raise JMAPError("Client not initialized")
 
+        async with self._mailbox_lock:
+            return await self._load_mailbox_cache()
+
+    async def _load_mailbox_cache(self) -> MailboxCache:
+        cache = self._mailboxes
+        if cache is not None:
+            if cache.is_fresh():
+                return cache
+            if await self._mailboxes_unchanged(cache.state):
+                cache.checked_at = time.monotonic()
+                return cache
+
         try:
             # Query all mailboxes, then get their details
-            results = self._client.request(
+            results = await self._request(
                 [
                     MailboxQuery(),
-                    MailboxGet(ids=Ref("/ids")),
+                    MailboxGet(ids=Ref("/ids"), properties=MAILBOX_PROPERTIES),
                 ]
             )
 
@@ -90,12 +348,29 @@ class JMAPClient:
                     }
                 )
 
-            return mailboxes
+            self._mailboxes = MailboxCache(mailbox_response.state, mailboxes)
+            return self._mailboxes
 
         except Exception as e:
-            logger.error(f"Failed to get mailboxes: {e}")
+            self._mailboxes = None
+            logger.error("Failed to get mailboxes: %s", e)
             raise JMAPError(f"Failed to get mailboxes: {e}")
 
+    async def _mailboxes_unchanged(self, state: str) -> bool:
+        """Check with Mailbox/changes whether the mailbox state still holds."""
+        try:
+            results = await self._request([MailboxChanges(since_state=state)])
+        except Exception as e:
+            logger.debug("Mailbox/changes failed, refetching mailboxes: %s", e)
+            return False
+
+        response = results[0].response
+        # Servers answer with an error (e.g. cannotCalculateChanges) when
+        # the old state is too old to diff against
+        return (
+            isinstance(response, MailboxChangesResponse) and response.new_state == state
+        )
+
     async def search_emails(
         self,
         filter_conditions: Optional[Dict[str, Any]] = None,
@@ -107,50 +382,13 @@ class JMAPClient:
         if not self._client:
             raise JMAPError("Client not initialized")
 
-        try:
-            # Build filter using jmapc's EmailQueryFilterCondition
-            filter_kwargs = {}
-
-            if mailbox_id:
-                filter_kwargs["in_mailbox"] = mailbox_id
-
-            # Add other filter conditions
-            if filter_conditions:
-                if "text" in filter_conditions:
-                    filter_kwargs["text"] = filter_conditions["text"]
-                if "subject" in filter_conditions:
-                    filter_kwargs["subject"] = filter_conditions["subject"]
-                if "from" in filter_conditions:
-                    filter_kwargs["from_addresses"] = filter_conditions["from"]
-                if "to" in filter_conditions:
-                    filter_kwargs["to"] = filter_conditions["to"]
-
-            # Build sort using jmapc's Comparator
-            sort_comparators = []
-            if sort:
-                for sort_item in sort:
-                    sort_comparators.append(
-                        Comparator(
-                            property=sort_item.get("property", "receivedAt"),
-                            is_ascending=sort_item.get("isAscending", False),
-                        )
-                    )
-            else:
-                sort_comparators = [
-                    Comparator(property="receivedAt", is_ascending=False)
-                ]
-
-            # Create query request
-            email_filter = (
-                EmailQueryFilterCondition(**filter_kwargs) if filter_kwargs else None
-            )
+        # Nothing can be returned, so skip the round-trip
+        if limit == 0:
+            return {"ids": [], "total": None, "limit": 0, "position": 0}
 
-            results = self._client.request(
-                [
-                    EmailQuery(
-                        filter=email_filter, sort=sort_comparators, limit=limit or 50
-                    )
-                ]
+        try:
+            results = await self._request(
+                [_email_query(filter_conditions, sort, limit, mailbox_id)]
             )
 
             query_response = results[0].response
@@ -163,102 +401,104 @@ class JMAPClient:
             }
 
         except Exception as e:
-            logger.error(f"Failed to search emails: {e}")
+            logger.error("Failed to search emails: %s", e)
             raise JMAPError(f"Failed to search emails: {e}")
 
-    async def get_emails(
+    async def search_and_fetch(
         self,
-        ids: List[str],
-        properties: Optional[List[str]] = None,
+        filter_conditions: Optional[Dict[str, Any]] = None,
+        properties: Optional[Sequence[str]] = None,
+        sort: Optional[List[Dict[str, str]]] = None,
+        limit: Optional[int] = None,
+        mailbox_id: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """Get email details by IDs."""
+        """Search for emails and get their details in one request.
+
+        Email/get takes its ids from the Email/query result through a
+        back-reference, so the server resolves both in one round-trip.
+        """
         if not self._client:
             raise JMAPError("Client not initialized")
 
+        if limit == 0:
+            return []
+
+        if not properties:
+            properties = LIST_PROPERTIES
+
         try:
-            results = self._client.request(
+            results = await self._request(
                 [
-                    EmailGet(
-                        ids=ids,
-                        properties=properties
-                        or [
-                            "id",
-                            "subject",
-                            "from",
-                            "to",
-                            "cc",
-                            "bcc",
-                            "receivedAt",
-                            "size",
-                            "preview",
-                            "bodyStructure",
-                            "textBody",
-                            "htmlBody",
-                        ],
-                    )
+                    _email_query(filter_conditions, sort, limit, mailbox_id),
+                    EmailGet(ids=Ref("/ids"), properties=properties),
                 ]
             )
 
-            email_response = results[0].response
+            email_response = results[1].response
             if not isinstance(email_response, EmailGetResponse):
-                logger.error(
-                    f"Unexpected response type from EmailGet: {type(email_response)}"
-                )
                 raise JMAPError("Unexpected response type from EmailGet")
 
-            # Convert to expected format
-            emails = []
-            for email in email_response.data:
-                email_dict = {
-                    "id": email.id,
-                    "subject": email.subject or "",
-                    "from": [
-                        {"email": addr.email, "name": addr.name or ""}
-                        for addr in (
-                            getattr(email, "mail_from", None)
-                            or getattr(email, "from", None)
-                            or []
-                        )
-                    ],
-                    "to": [
-                        {"email": addr.email, "name": addr.name or ""}
-                        for addr in (email.to or [])
-                    ],
-                    "cc": (
-                        [
-                            {"email": addr.email, "name": addr.name or ""}
-                            for addr in (email.cc or [])
-                        ]
-                        if email.cc
-                        else []
-                    ),
-                    "bcc": (
+            return [_email_to_dict(email, properties) for email in email_response.data]
+
+        except Exception as e:
+            logger.error("Failed to search emails: %s", e)
+            raise JMAPError(f"Failed to search emails: {e}")
+
+    async def get_emails(
+        self,
+        ids: List[str],
+        properties: Optional[Sequence[str]] = None,
+        include_body: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Get email details by IDs.
+
+        Without explicit properties only listing fields are fetched; pass
+        include_body=True to also fetch recipients and body parts.
+        """
+        if not self._client:
+            raise JMAPError("Client not initialized")
+
+        if not ids:
+            return []
+
+        if not properties:
+            properties = FULL_PROPERTIES if include_body else LIST_PROPERTIES
+
+        try:
+            # Servers cap the ids per Email/get, so split large lists into
+            # chunks and fetch them concurrently; _request bounds how many
+            # are in flight
+            chunk_results = await asyncio.gather(
+                *(
+                    self._request(
                         [
-                            {"email": addr.email, "name": addr.name or ""}
-                            for addr in (email.bcc or [])
+                            EmailGet(
+                                ids=ids[i : i + EMAIL_GET_CHUNK_SIZE],
+                                properties=properties,
+                            )
                         ]
-                        if email.bcc
-                        else []
-                    ),
-                    "receivedAt": (
-                        email.received_at.isoformat() if email.received_at else None
-                    ),
-                    "size": email.size or 0,
-                    "preview": email.preview or "",
-                }
-
-                # Handle body content
-                if hasattr(email, "text_body") and email.text_body:
-                    email_dict["textBody"] = email.text_body
-                if hasattr(email, "html_body") and email.html_body:
-                    email_dict["htmlBody"] = email.html_body
-
-                emails.append(email_dict)
+                    )
+                    for i in range(0, len(ids), EMAIL_GET_CHUNK_SIZE)
+                )
+            )
+
+            emails = []
+            for results in chunk_results:
+                email_response = results[0].response
+                if not isinstance(email_response, EmailGetResponse):
+                    logger.error(
+                        "Unexpected response type from EmailGet: %s",
+                        type(email_response),
+                    )
+                    raise JMAPError("Unexpected response type from EmailGet")
+                emails.extend(
+                    _email_to_dict(email, properties) for email in email_response.data
+                )
 
             return emails
 
         except Exception as e:
-            logger.error(f"Failed to get emails: {e}")
+            logger.error("Failed to get emails: %s", e)
             raise JMAPError(f"Failed to get emails: {e}")
 
     async def create_draft(
@@ -276,34 +516,11 @@ class JMAPClient:
             raise JMAPError("Client not initialized")
 
         try:
-            # Get the Drafts mailbox ID
-            drafts_results = self._client.request(
-                [
-                    MailboxQuery(filter=MailboxQueryFilterCondition(name="Drafts")),
-                    MailboxGet(ids=Ref("/ids")),
-                ]
-            )
-
-            mailbox_response = drafts_results[1].response
-            if (
-                not isinstance(mailbox_response, MailboxGetResponse)
-                or not mailbox_response.data
-            ):
-                raise JMAPError("Drafts mailbox not found")
+            drafts_mailbox_id = await self._get_drafts_mailbox_id()
 
-            drafts_mailbox_id = mailbox_response.data[0].id
-
-            # Get identity for from address if not provided
+            # Use the primary identity for from address if not provided
             if not from_address:
-                identity_results = self._client.request([IdentityGet()])
-                identity_response = identity_results[0].response
-                if (
-                    not isinstance(identity_response, IdentityGetResponse)
-                    or not identity_response.data
-                ):
-                    raise JMAPError("No identity found")
-
-                identity = identity_response.data[0]
+                identity = await self._get_identity()
                 from_address = {"email": identity.email, "name": identity.name or ""}
 
             # Convert address dicts to EmailAddress objects
@@ -355,7 +572,7 @@ class JMAPClient:
             email = Email(**email_kwargs)
 
             # Create the draft
-            results = self._client.request([EmailSet(create={"draft": email})])
+            results = await self._request([EmailSet(create={"draft": email})])
 
             email_set_response = results[0].response
             if hasattr(email_set_response, "created") and email_set_response.created:
@@ -364,7 +581,8 @@ class JMAPClient:
                 raise JMAPError("Failed to create draft email")
 
         except Exception as e:
-            logger.error(f"Failed to create draft: {e}")
+            self._invalidate_lookups()
+            logger.error("Failed to create draft: %s", e)
             raise JMAPError(f"Failed to create draft: {e}")
 
     async def send_email(self, email_id: str) -> bool:
@@ -373,52 +591,18 @@ class JMAPClient:
             raise JMAPError("Client not initialized")
 
         try:
-            # Get the email to extract recipients for the envelope
-            email_results = self._client.request(
-                [EmailGet(ids=[email_id], properties=["to", "cc", "bcc"])]
-            )
-
-            email_response = email_results[0].response
-            if (
-                not isinstance(email_response, EmailGetResponse)
-                or not email_response.data
-            ):
-                raise JMAPError("Email not found")
+            identity = await self._get_identity()
 
-            email = email_response.data[0]
-
-            # Get identity for sending
-            identity_results = self._client.request([IdentityGet()])
-            identity_response = identity_results[0].response
-            if (
-                not isinstance(identity_response, IdentityGetResponse)
-                or not identity_response.data
-            ):
-                raise JMAPError("No identity found")
-
-            identity = identity_response.data[0]
-
-            # Build recipient list for envelope
-            rcpt_to = []
-            if email.to:
-                rcpt_to.extend([Address(email=addr.email) for addr in email.to])
-            if email.cc:
-                rcpt_to.extend([Address(email=addr.email) for addr in email.cc])
-            if email.bcc:
-                rcpt_to.extend([Address(email=addr.email) for addr in email.bcc])
-
-            # Send the email using EmailSubmissionSet
-            results = self._client.request(
+            # Send the email using EmailSubmissionSet. The envelope is left
+            # unset so the server builds it from the draft's From/To/Cc/Bcc
+            # headers (RFC 8621 section 7), which saves fetching the email.
+            results = await self._request(
                 [
                     EmailSubmissionSet(
                         create={
                             "send": EmailSubmission(
                                 email_id=email_id,
                                 identity_id=identity.id,
-                                envelope=Envelope(
-                                    mail_from=Address(email=identity.email),
-                                    rcpt_to=rcpt_to,
-                                ),
                             )
                         },
                     )
@@ -431,9 +615,53 @@ class JMAPClient:
             )
 
         except Exception as e:
-            logger.error(f"Failed to send email: {e}")
+            self._invalidate_lookups()
+            logger.error("Failed to send email: %s", e)
             raise JMAPError(f"Failed to send email: {e}")
 
+    async def _get_drafts_mailbox_id(self) -> str:
+        """Get the Drafts mailbox ID, resolving it on first use."""
+        if self._drafts_mailbox_id is None:
+            calls = [MailboxQuery(filter=MailboxQueryFilterCondition(name="Drafts"))]
+            # Piggyback the identity lookup so drafts need one round-trip
+            if self._identity is None:
+                calls.append(IdentityGet())
+            results = await self._request(calls)
+
+            mailbox_response = results[0].response
+            if (
+                not isinstance(mailbox_response, MailboxQueryResponse)
+                or not mailbox_response.ids
+            ):
+                raise JMAPError("Drafts mailbox not found")
+            self._drafts_mailbox_id = mailbox_response.ids[0]
+
+            if len(results) > 1:
+                self._set_identity(results[1].response)
+
+        return self._drafts_mailbox_id
+
+    async def _get_identity(self) -> Identity:
+        """Get the primary identity, resolving it on first use."""
+        if self._identity is None:
+            results = await self._request([IdentityGet()])
+            self._set_identity(results[0].response)
+        return self._identity
+
+    def _set_identity(self, identity_response: Any) -> None:
+        """Cache the primary identity from an Identity/get response."""
+        if (
+            not isinstance(identity_response, IdentityGetResponse)
+            or not identity_response.data
+        ):
+            raise JMAPError("No identity found")
+        self._identity = identity_response.data[0]
+
+    def _invalidate_lookups(self) -> None:
+        """Drop cached Drafts mailbox and identity so they are re-resolved."""
+        self._drafts_mailbox_id = None
+        self._identity = None
+
     async def get_account_id(self) -> str:
         """Get the primary account ID."""
         if not self._client:
@@ -443,5 +671,5 @@ class JMAPClient:
             # jmapc handles account IDs internally
             return "primary"
         except Exception as e:
-            logger.error(f"Failed to get account ID: {e}")
+            logger.error("Failed to get account ID: %s", e)
             raise JMAPError(f"Failed to get account ID: {e}")
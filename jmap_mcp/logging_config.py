@@ -1,9 +1,34 @@
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from pathlib import Path
 from typing import Optional
 
+# Background listener that writes queued records to the real handlers
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# Log directories already created by this process
+_LOG_DIRS_ENSURED: set[str] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory once per process, skipping repeat mkdir calls."""
+    key = str(path)
+    if key not in _LOG_DIRS_ENSURED:
+        path.mkdir(parents=True, exist_ok=True)
+        _LOG_DIRS_ENSURED.add(key)
+
+
+@atexit.register
+def _stop_listener() -> None:
+    """Flush queued records and stop the background listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
 def setup_logging(
     level: str = "INFO",
@@ -19,6 +44,12 @@ def setup_logging(
         max_file_size: Maximum size of log file before rotation (in bytes)
         backup_count: Number of backup files to keep
     """
+    # Skip collecting record attributes our formatter never prints
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False
+
     # Convert string level to logging level
     numeric_level = getattr(logging, level.upper(), logging.INFO)
 
@@ -27,7 +58,9 @@ def setup_logging(
     root_logger.setLevel(numeric_level)
 
     # Clear any existing handlers
+    _stop_listener()
     root_logger.handlers.clear()
+    handlers = []
 
     # Create formatter
     formatter = logging.Formatter(
@@ -39,13 +72,12 @@ def setup_logging(
     console_handler = logging.StreamHandler()
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     # File handler (optional)
     if log_file:
         # Create log directory if it doesn't exist
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(Path(log_file).parent)
 
         # Use rotating file handler to prevent huge log files
         file_handler = logging.handlers.RotatingFileHandler(
@@ -56,8 +88,19 @@ def setup_logging(
         )
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
+    # Handlers run on a background thread so disk writes and log rotation
+    # never block the asyncio event loop
+    global _listener
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _listener.start()
+
+    if log_file:
         # Log that file logging is enabled
         logging.info(f"File logging enabled: {log_file}")
 
@@ -75,5 +118,5 @@ def get_default_log_file() -> str:
     else:  # Unix-like (including macOS)
         log_dir = Path.home() / ".local" / "share" / "jmap-mcp" / "logs"
 
-    log_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(log_dir)
     return str(log_dir / "jmap-mcp.log")
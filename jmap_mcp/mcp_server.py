@@ -1,42 +1,207 @@
+import asyncio
+import importlib
+import io
 import logging
-from datetime import datetime
-from typing import Any, Dict, List
+from contextlib import asynccontextmanager
+from datetime import timezone
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional
 
 from mcp.server.fastmcp import FastMCP
 
-from jmap_mcp.jmap_client import JMAPClient, JMAPError
 from jmap_mcp.config import config
 from jmap_mcp.logging_config import setup_logging
 
+if TYPE_CHECKING:
+    from jmap_mcp.jmap_client import JMAPClient
+
+# jmap_mcp.jmap_client pulls in jmapc and requests, which is a large share of
+# startup time; it is imported inside each tool, and by the warm-up in a
+# worker thread, so the MCP handshake is not held up by modules only a tool
+# invocation needs
+
 logger = logging.getLogger(__name__)
 
-mcp = FastMCP("JMAP MCP Server")
+# One client serves every tool call for the life of the server, so the
+# session and the drafts mailbox and identity lookups are reused
+_client: Optional["JMAPClient"] = None
+_client_lock = asyncio.Lock()
 
 
-@mcp.tool()
-async def list_mailboxes() -> str:
-    """List all mailboxes in the Fastmail account with email counts"""
+async def get_client() -> "JMAPClient":
+    """Get the shared JMAP client, connecting it on first use."""
+    global _client
+    async with _client_lock:
+        if _client is None:
+            from jmap_mcp.jmap_client import JMAPClient
+
+            client = JMAPClient()
+            await client.__aenter__()
+            _client = client
+        return _client
+
+
+async def _close_client() -> None:
+    """Close the shared JMAP client if one was created."""
+    global _client
+    async with _client_lock:
+        if _client is not None:
+            await _client.__aexit__(None, None, None)
+            _client = None
+
+
+async def _warm_up() -> None:
+    """Connect and load the mailbox cache ahead of the first tool call."""
     try:
-        async with JMAPClient() as client:
-            mailboxes = await client.get_mailboxes()
+        # Import off the event loop so the handshake is served meanwhile
+        await asyncio.to_thread(importlib.import_module, "jmap_mcp.jmap_client")
+        client = await get_client()
+        await client.get_mailbox_cache()
+    except Exception as e:
+        # Tools connect on demand and report the error themselves
+        logger.warning("JMAP warm-up failed: %s", e)
 
-            result_lines = ["# Mailboxes", ""]
 
-            for mailbox in mailboxes:
-                name = mailbox.get("name", "Unknown")
-                role = mailbox.get("role", "")
-                total_emails = mailbox.get("totalEmails", 0)
-                unread_emails = mailbox.get("unreadEmails", 0)
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Warm up the shared JMAP client and release it on shutdown.
 
-                role_display = f" ({role})" if role else ""
-                result_lines.append(
-                    f"**{name}**{role_display}: {unread_emails}/{total_emails} unread/total emails"
-                )
+    The warm-up runs while the MCP client is still initializing, so
+    session discovery and the mailbox fetch overlap the handshake.
+    """
+    warm_up = asyncio.create_task(_warm_up())
+    try:
+        yield
+    finally:
+        warm_up.cancel()
+        await _close_client()
+
+
+mcp = FastMCP("JMAP MCP Server", lifespan=_lifespan)
+
+# Email properties fetched by the search and read tools
+_SEARCH_PROPERTIES = (
+    "id",
+    "subject",
+    "from",
+    "to",
+    "receivedAt",
+    "preview",
+    "keywords",
+)
+_READ_PROPERTIES = (
+    "id",
+    "subject",
+    "from",
+    "to",
+    "cc",
+    "receivedAt",
+    "sentAt",
+    "size",
+    "preview",
+    "keywords",
+    "textBody",
+)
+# HTML body parts are only rendered when read_email is asked for them
+_READ_HTML_PROPERTIES = _READ_PROPERTIES + ("htmlBody",)
+
+
+# Date formats for search listings and the read_email header; header times
+# are converted to UTC first, since sentAt carries the sender's offset
+_DATE_FMT = "%Y-%m-%d %H:%M"
+_DATETIME_FMT = "%Y-%m-%d %H:%M:%S %Z"
+
+# JMAP keyword set on emails that have been read
+_SEEN = "$seen"
+
+# Fixed pieces of the rendered Markdown
+_UNREAD = " \U0001f534"  # red circle
+_NO_SUBJECT = "(No subject)"
+_UNKNOWN_SENDER = "Unknown sender"
+_TEXT_SECTION = "## Email Content (Text)\n\n"
+_PREVIEW_NOTE = (
+    "*Note: This is a preview. Full body content requires separate download.*\n\n"
+)
+_BODY_NOTE = "*Email body content available but requires separate download.*\n\n"
+_HTML_SECTION = (
+    "## Email Content (HTML)\n\n"
+    "*HTML content available but requires separate download.*\n\n"
+)
+
+# send_draft status lines, led by check mark, cross and memo emoji
+_SENT = "\u2705 **Email sent successfully!**\n\n"
+_SEND_FAILED = "\u274c **Failed to send email.** The draft has been saved.\n\n"
+_SEND_ERROR = "\u274c **Error sending email:** "
+_DRAFT_SAVED = (
+    "\U0001f4dd **Draft saved.** Use the Fastmail interface to send it, "
+    "or call this tool again with send_immediately=true.\n\n"
+)
+
+
+def _fmt_addrs(addrs: List[Dict[str, str]]) -> str:
+    """Format addresses as a comma-separated "Name <email>" list."""
+    return ", ".join(
+        f"{a['name']} <{a['email']}>" if a.get("name") else a.get("email", "")
+        for a in addrs or ()
+    )
+
+
+def _parse_addresses(addresses: Optional[List[Any]]) -> List[Dict[str, str]]:
+    """Convert an address list to JMAP format.
+
+    Raises:
+        ValueError: If an entry is neither an email string nor a dict
+            with an "email" key.
+    """
+    if not addresses:
+        return []
+
+    # Tool callers almost always pass plain email strings
+    if all(type(addr) is str for addr in addresses):
+        return [{"email": addr} for addr in addresses]
+
+    result = []
+    for addr in addresses:
+        if isinstance(addr, str):
+            # Simple email address
+            result.append({"email": addr})
+        elif isinstance(addr, dict):
+            # Already in correct format or has name/email
+            if "email" not in addr:
+                raise ValueError(f"Invalid address format: {addr}")
+            result.append(addr)
+        else:
+            raise ValueError(f"Invalid address type: {type(addr)}")
+    return result
 
-            if not mailboxes:
-                result_lines.append("No mailboxes found.")
 
-            return "\n".join(result_lines)
+@mcp.tool()
+async def list_mailboxes() -> str:
+    """List all mailboxes in the Fastmail account with email counts"""
+    from jmap_mcp.jmap_client import JMAPError
+
+    try:
+        client = await get_client()
+        mailboxes = await client.get_mailboxes()
+
+        buf = io.StringIO()
+        w = buf.write
+        w("# Mailboxes\n\n")
+
+        for mailbox in mailboxes:
+            name = mailbox.get("name", "Unknown")
+            role = mailbox.get("role", "")
+            total_emails = mailbox.get("totalEmails", 0)
+            unread_emails = mailbox.get("unreadEmails", 0)
+
+            role_display = f" ({role})" if role else ""
+            w(
+                f"**{name}**{role_display}: {unread_emails}/{total_emails} unread/total emails\n"
+            )
+
+        if not mailboxes:
+            w("No mailboxes found.\n")
+
+        return buf.getvalue()
 
     except JMAPError as e:
         error_msg = f"JMAP error: {e}"
@@ -67,98 +232,74 @@ async def search_email(
         unread_only: Only return unread emails
         limit: Maximum number of emails to return (1-100)
     """
+    from jmap_mcp.jmap_client import JMAPError
+
     try:
-        async with JMAPClient() as client:
-            # Build filter conditions
-            filter_conditions = {}
-
-            if query:
-                filter_conditions["text"] = query
-
-            if sender:
-                filter_conditions["from"] = sender
-
-            if subject:
-                filter_conditions["subject"] = subject
-
-            if unread_only:
-                filter_conditions["notKeyword"] = "$seen"
-
-            if mailbox:
-                # Find mailbox by name
-                mailboxes = await client.get_mailboxes()
-                target_mailbox = None
-                for mb in mailboxes:
-                    if (
-                        mb.get("name", "").lower() == mailbox.lower()
-                        or mb.get("role") == mailbox.lower()
-                    ):
-                        target_mailbox = mb
-                        break
-
-                if target_mailbox:
-                    filter_conditions["inMailbox"] = target_mailbox["id"]
-                else:
-                    return f"Mailbox '{mailbox}' not found"
-
-            # Search for emails
-            search_results = await client.search_emails(
-                filter_conditions=filter_conditions if filter_conditions else None,
-                limit=min(max(limit, 1), 100),
+        client = await get_client()
+        # Build filter conditions
+        filter_conditions = {}
+
+        if query:
+            filter_conditions["text"] = query
+
+        if sender:
+            filter_conditions["from"] = sender
+
+        if subject:
+            filter_conditions["subject"] = subject
+
+        if unread_only:
+            filter_conditions["not_keyword"] = _SEEN
+
+        mailbox_id = None
+        if mailbox:
+            # Find mailbox by name or role
+            mailboxes = await client.get_mailbox_cache()
+            target_mailbox = mailboxes.find(mailbox)
+
+            if target_mailbox:
+                mailbox_id = target_mailbox["id"]
+            else:
+                return f"Mailbox '{mailbox}' not found"
+
+        # Search for emails and fetch their details in one request
+        emails = await client.search_and_fetch(
+            filter_conditions=filter_conditions if filter_conditions else None,
+            properties=_SEARCH_PROPERTIES,
+            mailbox_id=mailbox_id,
+            limit=min(max(limit, 1), 100),
+        )
+
+        if not emails:
+            return "No emails found matching the search criteria."
+
+        buf = io.StringIO()
+        w = buf.write
+        w(f"# Search Results ({len(emails)} emails)\n\n")
+
+        for email in emails:
+            subject = email.get("subject") or _NO_SUBJECT
+            sender = email.get("from")
+            from_addr = (
+                sender[0].get("email", _UNKNOWN_SENDER) if sender else _UNKNOWN_SENDER
             )
+            received_at = email.get("receivedAt")
+            preview = email.get("preview", "")
+            is_unread = _SEEN not in email.get("keywords", ())
 
-            email_ids = search_results.get("ids", [])
-
-            if not email_ids:
-                return "No emails found matching the search criteria."
-
-            # Get email details
-            emails = await client.get_emails(
-                ids=email_ids,
-                properties=[
-                    "id",
-                    "subject",
-                    "from",
-                    "to",
-                    "receivedAt",
-                    "preview",
-                    "keywords",
-                ],
+            date_str = (
+                received_at.strftime(_DATE_FMT) if received_at else "Unknown date"
             )
 
-            result_lines = [f"# Search Results ({len(emails)} emails)", ""]
+            unread_indicator = _UNREAD if is_unread else ""
 
-            for email in emails:
-                subject = email.get("subject", "(No subject)")
-                from_addr = email.get("from", [{}])[0].get("email", "Unknown sender")
-                received_at = email.get("receivedAt", "")
-                preview = email.get("preview", "")
-                is_unread = "$seen" not in email.get("keywords", [])
+            w(f"## {subject}{unread_indicator}\n")
+            w(f"**From:** {from_addr}\n")
+            w(f"**Date:** {date_str}\n")
+            w(f"**Preview:** {preview[:200]}{'...' if len(preview) > 200 else ''}\n")
+            w(f"**ID:** {email.get('id')}\n\n")
 
-                # Format date
-                try:
-                    if received_at:
-                        dt = datetime.fromisoformat(received_at.replace("Z", "+00:00"))
-                        date_str = dt.strftime("%Y-%m-%d %H:%M")
-                    else:
-                        date_str = "Unknown date"
-                except Exception:
-                    date_str = received_at
-
-                unread_indicator = " 🔴" if is_unread else ""
-
-                result_lines.extend(
-                    [
-                        f"## {subject}{unread_indicator}",
-                        f"**From:** {from_addr}",
-                        f"**Date:** {date_str}",
-                        f"**Preview:** {preview[:200]}{'...' if len(preview) > 200 else ''}",
-                        f"**ID:** {email.get('id')}",
-                        "",
-                    ]
-                )
-
-            return "\n".join(result_lines)
+        return buf.getvalue()
 
     except JMAPError as e:
         error_msg = f"JMAP error: {e}"
@@ -178,185 +319,84 @@ async def read_email(email_id: str, include_html: bool = False) -> str:
         email_id: The ID of the email to read
         include_html: Whether to include HTML body information
     """
+    from jmap_mcp.jmap_client import JMAPError
+
     if not email_id:
         return "Error: email_id parameter is required"
 
     try:
-        async with JMAPClient() as client:
-            emails = await client.get_emails(
-                ids=[email_id],
-                properties=[
-                    "id",
-                    "subject",
-                    "from",
-                    "to",
-                    "cc",
-                    "bcc",
-                    "replyTo",
-                    "receivedAt",
-                    "sentAt",
-                    "size",
-                    "preview",
-                    "keywords",
-                    "bodyStructure",
-                    "textBody",
-                    "htmlBody",
-                ],
-            )
+        client = await get_client()
+        properties = _READ_HTML_PROPERTIES if include_html else _READ_PROPERTIES
+        emails = await client.get_emails(ids=[email_id], properties=properties)
 
-            if not emails:
-                return f"Email with ID '{email_id}' not found"
+        if not emails:
+            return f"Email with ID '{email_id}' not found"
 
-            email = emails[0]
+        email = emails[0]
 
-            result_lines = []
+        buf = io.StringIO()
+        w = buf.write
 
-            subject = email.get("subject", "(No subject)")
-            is_unread = "$seen" not in email.get("keywords", [])
-            unread_indicator = " 🔴" if is_unread else ""
+        subject = email.get("subject") or _NO_SUBJECT
+        is_unread = _SEEN not in email.get("keywords", ())
+        unread_indicator = _UNREAD if is_unread else ""
 
-            result_lines.extend(
-                [
-                    f"# {subject}{unread_indicator}",
-                    "",
-                    "## Email Details",
-                    "",
-                ]
-            )
+        w(f"# {subject}{unread_indicator}\n\n## Email Details\n\n")
 
-            from_addresses = email.get("from", [])
-            if from_addresses:
-                from_list = []
-                for addr in from_addresses:
-                    name = addr.get("name", "")
-                    email_addr = addr.get("email", "")
-                    if name:
-                        from_list.append(f"{name} <{email_addr}>")
-                    else:
-                        from_list.append(email_addr)
-                result_lines.append(f"**From:** {', '.join(from_list)}")
-
-            to_addresses = email.get("to", [])
-            if to_addresses:
-                to_list = []
-                for addr in to_addresses:
-                    name = addr.get("name", "")
-                    email_addr = addr.get("email", "")
-                    if name:
-                        to_list.append(f"{name} <{email_addr}>")
-                    else:
-                        to_list.append(email_addr)
-                result_lines.append(f"**To:** {', '.join(to_list)}")
-
-            cc_addresses = email.get("cc", [])
-            if cc_addresses:
-                cc_list = []
-                for addr in cc_addresses:
-                    name = addr.get("name", "")
-                    email_addr = addr.get("email", "")
-                    if name:
-                        cc_list.append(f"{name} <{email_addr}>")
-                    else:
-                        cc_list.append(email_addr)
-                result_lines.append(f"**CC:** {', '.join(cc_list)}")
-
-            received_at = email.get("receivedAt", "")
-            sent_at = email.get("sentAt", "")
-
-            try:
-                if received_at:
-                    dt = datetime.fromisoformat(received_at.replace("Z", "+00:00"))
-                    result_lines.append(
-                        f"**Received:** {dt.strftime('%Y-%m-%d %H:%M:%S %Z')}"
-                    )
-
-                if sent_at and sent_at != received_at:
-                    dt = datetime.fromisoformat(sent_at.replace("Z", "+00:00"))
-                    result_lines.append(
-                        f"**Sent:** {dt.strftime('%Y-%m-%d %H:%M:%S %Z')}"
-                    )
-            except Exception:
-                if received_at:
-                    result_lines.append(f"**Received:** {received_at}")
-                if sent_at:
-                    result_lines.append(f"**Sent:** {sent_at}")
-
-            size = email.get("size", 0)
-            if size:
-                if size < 1024:
-                    size_str = f"{size} bytes"
-                elif size < 1024 * 1024:
-                    size_str = f"{size / 1024:.1f} KB"
-                else:
-                    size_str = f"{size / (1024 * 1024):.1f} MB"
-                result_lines.append(f"**Size:** {size_str}")
-
-            result_lines.append("")
-
-            text_body_parts = email.get("textBody", [])
-            html_body_parts = email.get("htmlBody", [])
-
-            if text_body_parts:
-                result_lines.extend(
-                    [
-                        "## Email Content (Text)",
-                        "",
-                    ]
-                )
+        from_addresses = email.get("from")
+        if from_addresses:
+            w(f"**From:** {_fmt_addrs(from_addresses)}\n")
 
-                # For now, we'll use the preview if available, or indicate that body parts need to be downloaded
-                # In a full implementation, you would download the body parts using the blobId
-                preview = email.get("preview", "")
-                if preview:
-                    result_lines.extend(
-                        [
-                            preview,
-                            "",
-                            "*Note: This is a preview. Full body content requires separate download.*",
-                            "",
-                        ]
-                    )
-                else:
-                    result_lines.extend(
-                        [
-                            "*Email body content available but requires separate download.*",
-                            "",
-                        ]
-                    )
-
-            if include_html and html_body_parts:
-                result_lines.extend(
-                    [
-                        "## Email Content (HTML)",
-                        "",
-                        "*HTML content available but requires separate download.*",
-                        "",
-                    ]
-                )
+        to_addresses = email.get("to")
+        if to_addresses:
+            w(f"**To:** {_fmt_addrs(to_addresses)}\n")
 
-            body_structure = email.get("bodyStructure", {})
-            if body_structure:
-                result_lines.extend(
-                    [
-                        "## Body Structure",
-                        "",
-                        f"**Type:** {body_structure.get('type', 'Unknown')}",
-                    ]
-                )
+        cc_addresses = email.get("cc")
+        if cc_addresses:
+            w(f"**CC:** {_fmt_addrs(cc_addresses)}\n")
+
+        received_at = email.get("receivedAt")
+        sent_at = email.get("sentAt")
+
+        if received_at:
+            received_at = received_at.astimezone(timezone.utc)
+            w(f"**Received:** {received_at.strftime(_DATETIME_FMT)}\n")
+
+        if sent_at and sent_at != received_at:
+            sent_at = sent_at.astimezone(timezone.utc)
+            w(f"**Sent:** {sent_at.strftime(_DATETIME_FMT)}\n")
 
-                if "size" in body_structure:
-                    result_lines.append(f"**Size:** {body_structure['size']} bytes")
+        size = email.get("size", 0)
+        if size:
+            if size < 1024:
+                size_str = f"{size} bytes"
+            elif size < 1024 * 1024:
+                size_str = f"{size / 1024:.1f} KB"
+            else:
+                size_str = f"{size / (1024 * 1024):.1f} MB"
+            w(f"**Size:** {size_str}\n")
 
-                sub_parts = body_structure.get("subParts", [])
-                if sub_parts:
-                    result_lines.append(f"**Parts:** {len(sub_parts)} parts")
-                    for i, part in enumerate(sub_parts, 1):
-                        part_type = part.get("type", "Unknown")
-                        result_lines.append(f"  {i}. {part_type}")
+        w("\n")
 
-                result_lines.append("")
+        text_body_parts = email.get("textBody", [])
+        html_body_parts = email.get("htmlBody", [])
 
-            return "\n".join(result_lines)
+        if text_body_parts:
+            w(_TEXT_SECTION)
+
+            # For now, we'll use the preview if available, or indicate that body parts need to be downloaded
+            # In a full implementation, you would download the body parts using the blobId
+            preview = email.get("preview", "")
+            if preview:
+                w(f"{preview}\n\n")
+                w(_PREVIEW_NOTE)
+            else:
+                w(_BODY_NOTE)
+
+        if include_html and html_body_parts:
+            w(_HTML_SECTION)
+
+        return buf.getvalue()
 
     except JMAPError as e:
         error_msg = f"JMAP error: {e}"
@@ -389,6 +429,8 @@ async def send_draft(
         bcc: List of BCC recipient email addresses
         send_immediately: Whether to send the email immediately after creating the draft
     """
+    from jmap_mcp.jmap_client import JMAPError
+
     try:
         if not subject and not text_body and not html_body:
             return "Error: At least one of subject, text_body, or html_body is required"
@@ -396,120 +438,63 @@ async def send_draft(
         if not to:
             return "Error: At least one 'to' address is required"
 
-        def parse_addresses(addresses):
-            """Convert address list to JMAP format."""
-            if not addresses:
-                return []
-
-            result = []
-            for addr in addresses:
-                if isinstance(addr, str):
-                    # Simple email address
-                    result.append({"email": addr})
-                elif isinstance(addr, dict):
-                    # Already in correct format or has name/email
-                    if "email" in addr:
-                        result.append(addr)
-                    else:
-                        return f"Error: Invalid address format: {addr}"
-                else:
-                    return f"Error: Invalid address type: {type(addr)}"
-            return result
-
-        parsed_to = parse_addresses(to)
-        parsed_cc = parse_addresses(cc) if cc else []
-        parsed_bcc = parse_addresses(bcc) if bcc else []
-
-        if isinstance(parsed_to, str):
-            return parsed_to
-        if isinstance(parsed_cc, str):
-            return parsed_cc
-        if isinstance(parsed_bcc, str):
-            return parsed_bcc
-
-        async with JMAPClient() as client:
-            try:
-                email_id = await client.create_draft(
-                    subject=subject,
-                    to_addresses=parsed_to,
-                    cc_addresses=parsed_cc if parsed_cc else None,
-                    bcc_addresses=parsed_bcc if parsed_bcc else None,
-                    text_body=text_body if text_body else None,
-                    html_body=html_body if html_body else None,
-                )
+        try:
+            parsed_to = _parse_addresses(to)
+            parsed_cc = _parse_addresses(cc)
+            parsed_bcc = _parse_addresses(bcc)
+        except ValueError as e:
+            return f"Error: {e}"
+
+        client = await get_client()
+        try:
+            email_id = await client.create_draft(
+                subject=subject,
+                to_addresses=parsed_to,
+                cc_addresses=parsed_cc if parsed_cc else None,
+                bcc_addresses=parsed_bcc if parsed_bcc else None,
+                text_body=text_body if text_body else None,
+                html_body=html_body if html_body else None,
+            )
 
-                result_lines = [
-                    "# Email Draft Created",
-                    "",
-                    f"**Subject:** {subject}",
-                    f"**To:** {', '.join([addr.get('email', '') for addr in parsed_to])}",
-                ]
-
-                if parsed_cc:
-                    result_lines.append(
-                        f"**CC:** {', '.join([addr.get('email', '') for addr in parsed_cc])}"
-                    )
-
-                if parsed_bcc:
-                    result_lines.append(
-                        f"**BCC:** {', '.join([addr.get('email', '') for addr in parsed_bcc])}"
-                    )
-
-                result_lines.extend(
-                    [
-                        f"**Email ID:** {email_id}",
-                        "",
-                    ]
+            buf = io.StringIO()
+            w = buf.write
+            w("# Email Draft Created\n\n")
+            w(f"**Subject:** {subject}\n")
+            w(f"**To:** {', '.join(addr.get('email', '') for addr in parsed_to)}\n")
+
+            if parsed_cc:
+                w(f"**CC:** {', '.join(addr.get('email', '') for addr in parsed_cc)}\n")
+
+            if parsed_bcc:
+                w(
+                    f"**BCC:** {', '.join(addr.get('email', '') for addr in parsed_bcc)}\n"
                 )
 
-                if text_body:
-                    result_lines.extend(
-                        [
-                            "**Text Content:**",
-                            text_body[:200] + ("..." if len(text_body) > 200 else ""),
-                            "",
-                        ]
-                    )
-
-                if send_immediately:
-                    try:
-                        success = await client.send_email(email_id)
-                        if success:
-                            result_lines.extend(
-                                [
-                                    "✅ **Email sent successfully!**",
-                                    "",
-                                ]
-                            )
-                        else:
-                            result_lines.extend(
-                                [
-                                    "❌ **Failed to send email.** The draft has been saved.",
-                                    "",
-                                ]
-                            )
-                    except Exception as send_error:
-                        result_lines.extend(
-                            [
-                                f"❌ **Error sending email:** {send_error}",
-                                "The draft has been saved and can be sent manually.",
-                                "",
-                            ]
-                        )
-                else:
-                    result_lines.extend(
-                        [
-                            "📝 **Draft saved.** Use the Fastmail interface to send it, or call this tool again with send_immediately=true.",
-                            "",
-                        ]
-                    )
-
-                return "\n".join(result_lines)
-
-            except JMAPError as e:
-                error_msg = f"Failed to create draft: {e}"
-                logger.error(error_msg)
-                return error_msg
+            w(f"**Email ID:** {email_id}\n\n")
+
+            if text_body:
+                w("**Text Content:**\n")
+                w(text_body[:200] + ("..." if len(text_body) > 200 else "") + "\n\n")
+
+            if send_immediately:
+                try:
+                    success = await client.send_email(email_id)
+                    if success:
+                        w(_SENT)
+                    else:
+                        w(_SEND_FAILED)
+                except Exception as send_error:
+                    w(f"{_SEND_ERROR}{send_error}\n")
+                    w("The draft has been saved and can be sent manually.\n\n")
+            else:
+                w(_DRAFT_SAVED)
+
+            return buf.getvalue()
+
+        except JMAPError as e:
+            error_msg = f"Failed to create draft: {e}"
+            logger.error(error_msg)
+            return error_msg
 
     except Exception as e:
         error_msg = f"Unexpected error creating email draft: {e}"
@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 import os
 import sys
-import subprocess
 from pathlib import Path
 
+import pytest
+
 
 def check_dependencies():
     """Check if required dependencies are installed."""
@@ -21,8 +22,7 @@ def check_dependencies():
 def run_unit_tests():
     """Run unit tests only (no integration tests)."""
     print("🧪 Running unit tests...")
-    cmd = ["pytest", "tests/", "-m", "not integration", "-v"]
-    return subprocess.run(cmd).returncode
+    return pytest.main(["tests/", "-m", "not integration", "-v"])
 
 
 def run_integration_tests():
@@ -36,29 +36,20 @@ def run_integration_tests():
         print("   export FASTMAIL_AUTH_TOKEN_TEST=your_real_token")
         return 1
 
-    cmd = [
-        "pytest",
-        "tests/",
-        "-m",
-        "integration",
-        "-v",
-        "-s",
-    ]  # Added -s to see print output
-    return subprocess.run(cmd).returncode
+    # -s to see print output
+    return pytest.main(["tests/", "-m", "integration", "-v", "-s"])
 
 
 def run_all_tests():
     """Run all tests."""
     print("🚀 Running all tests...")
-    cmd = ["pytest", "tests/", "-v"]
-    return subprocess.run(cmd).returncode
+    return pytest.main(["tests/", "-v"])
 
 
 def run_specific_test(test_name):
     """Run a specific test file or test function."""
     print(f"🎯 Running specific test: {test_name}")
-    cmd = ["pytest", test_name, "-v", "-s"]
-    return subprocess.run(cmd).returncode
+    return pytest.main([test_name, "-v", "-s"])
 
 
 def main():
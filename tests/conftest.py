@@ -0,0 +1,22 @@
+import os
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect integration tests unless requested or a real token is set.
+
+    Without FASTMAIL_AUTH_TOKEN_TEST they would only skip, so the default
+    run leaves them out entirely; `-m integration` still selects them.
+    """
+    if os.getenv("FASTMAIL_AUTH_TOKEN_TEST") or "integration" in config.option.markexpr:
+        return
+
+    selected, deselected = [], []
+    for item in items:
+        if item.get_closest_marker("integration"):
+            deselected.append(item)
+        else:
+            selected.append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
@@ -1,12 +1,38 @@
+import asyncio
 import os
+import time
 import pytest
+import pytest_asyncio
 from unittest.mock import patch, MagicMock
 
 from jmapc import Client
+from jmapc.session import Session
 
 from jmap_mcp.auth import FastmailAuth
 from jmap_mcp.config import FastmailConfig
 
+SESSION_DATA = {
+    "username": "user@example.com",
+    "apiUrl": "https://api.fastmail.com/jmap/api/",
+    "downloadUrl": "https://api.fastmail.com/jmap/download/",
+    "uploadUrl": "https://api.fastmail.com/jmap/upload/",
+    "eventSourceUrl": "https://api.fastmail.com/jmap/event/",
+    "state": "state1",
+    "primaryAccounts": {"urn:ietf:params:jmap:core": "account1"},
+    "capabilities": {
+        "urn:ietf:params:jmap:core": {
+            "maxSizeUpload": 50000000,
+            "maxConcurrentUpload": 4,
+            "maxSizeRequest": 10000000,
+            "maxConcurrentRequests": 4,
+            "maxCallsInRequest": 16,
+            "maxObjectsInGet": 500,
+            "maxObjectsInSet": 500,
+            "collationAlgorithms": ["i;ascii-casemap"],
+        }
+    },
+}
+
 
 class TestFastmailAuth:
     """Test FastmailAuth authentication."""
@@ -21,6 +47,16 @@ class TestFastmailAuth:
             )
             yield mock_config
 
+    @pytest.fixture(autouse=True)
+    def shared_clients(self, tmp_path):
+        """Isolate the process-wide jmapc client and session caches."""
+        with (
+            patch.dict("jmap_mcp.auth._shared_clients", clear=True) as clients,
+            patch.dict("jmap_mcp.auth._persisted_sessions", clear=True),
+            patch("jmap_mcp.auth.SESSION_CACHE_DIR", tmp_path),
+        ):
+            yield clients
+
     @pytest.fixture
     def auth_client(self, mock_config):
         """FastmailAuth instance for testing."""
@@ -32,20 +68,6 @@ class TestFastmailAuth:
         assert auth_client.jmap_host == "api.fastmail.com"
         assert auth_client._client is None
 
-    def test_extract_host_from_url(self, auth_client):
-        """Test URL host extraction."""
-        assert (
-            auth_client._extract_host_from_url("https://api.fastmail.com/jmap/api/")
-            == "api.fastmail.com"
-        )
-        assert (
-            auth_client._extract_host_from_url("api.fastmail.com") == "api.fastmail.com"
-        )
-        assert (
-            auth_client._extract_host_from_url("https://custom.host.com/path")
-            == "custom.host.com"
-        )
-
     @patch("jmap_mcp.auth.Client.create_with_api_token")
     async def test_context_manager(self, mock_create_client, mock_config):
         """Test FastmailAuth as async context manager."""
@@ -60,6 +82,56 @@ class TestFastmailAuth:
             host="api.fastmail.com", api_token="test_token_123"
         )
 
+    @pytest.mark.asyncio
+    @patch("jmap_mcp.auth.Client.create_with_api_token")
+    async def test_client_shared_across_instances(
+        self, mock_create_client, mock_config
+    ):
+        """Test that auth instances reuse one jmapc client per host/token."""
+        async with FastmailAuth() as first, FastmailAuth() as second:
+            assert first.get_client() is second.get_client()
+
+        mock_create_client.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("jmap_mcp.auth.Client.create_with_api_token")
+    async def test_client_shared_when_entered_concurrently(
+        self, mock_create_client, mock_config
+    ):
+        """Test that concurrent first uses still build a single jmapc client."""
+
+        def slow_create(**kwargs):
+            # Widen the window in which worker threads could race
+            time.sleep(0.05)
+            return MagicMock()
+
+        mock_create_client.side_effect = slow_create
+        auths = await asyncio.gather(*(FastmailAuth().__aenter__() for _ in range(4)))
+
+        assert len({id(auth.get_client()) for auth in auths}) == 1
+        mock_create_client.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_session_cache_roundtrip(self, mock_config, shared_clients):
+        """Test that the JMAP session is persisted and reused by new clients."""
+        session = Session.from_dict(SESSION_DATA)
+
+        async with FastmailAuth() as auth:
+            auth.get_client().jmap_session = session
+            auth.save_session()
+
+        shared_clients.clear()
+
+        async with FastmailAuth() as auth:
+            assert auth.get_client().__dict__["jmap_session"] == session
+            auth.invalidate_session()
+            assert "jmap_session" not in auth.get_client().__dict__
+
+        shared_clients.clear()
+
+        async with FastmailAuth() as auth:
+            assert "jmap_session" not in auth.get_client().__dict__
+
     @patch("jmap_mcp.auth.Client.create_with_api_token")
     def test_get_client_success(self, mock_create_client, auth_client):
         """Test getting client when initialized."""
@@ -83,7 +155,7 @@ class TestFastmailAuth:
 
     async def test_get_valid_token_no_token(self, mock_config):
         """Test getting valid token with no token configured."""
-        mock_config.fastmail.auth_token = ""
+        mock_config.fastmail = FastmailConfig(auth_token="")
         auth_client = FastmailAuth()
 
         with pytest.raises(Exception) as exc_info:
@@ -91,6 +163,27 @@ class TestFastmailAuth:
         assert "No auth token configured" in str(exc_info.value)
 
 
+@pytest.fixture(scope="module")
+def real_token():
+    """Get real token from environment if available."""
+    return os.getenv("FASTMAIL_AUTH_TOKEN_TEST")
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def real_auth_client(real_token):
+    """Connected auth client with real token, shared by the module's tests."""
+    if not real_token:
+        pytest.skip("FASTMAIL_AUTH_TOKEN_TEST not set - skipping real token tests")
+
+    with patch("jmap_mcp.auth.config") as mock_config:
+        mock_config.fastmail = FastmailConfig(
+            auth_token=real_token,
+            jmap_base_url="https://api.fastmail.com/jmap/api/",
+        )
+        async with FastmailAuth() as auth:
+            yield auth
+
+
 class TestRealTokenIntegration:
     """Integration tests for real token validation.
 
@@ -98,65 +191,40 @@ class TestRealTokenIntegration:
     This is optional and will be skipped if not provided.
     """
 
-    @pytest.fixture
-    def real_token(self):
-        """Get real token from environment if available."""
-        return os.getenv("FASTMAIL_AUTH_TOKEN_TEST")
-
-    @pytest.fixture
-    def real_auth_client(self, real_token):
-        """Create auth client with real token if available."""
-        if not real_token:
-            pytest.skip("FASTMAIL_AUTH_TOKEN_TEST not set - skipping real token tests")
-
-        with patch("jmap_mcp.auth.config") as mock_config:
-            mock_config.fastmail = FastmailConfig(
-                auth_token=real_token,
-                jmap_base_url="https://api.fastmail.com/jmap/api/",
-            )
-            return FastmailAuth()
-
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     @pytest.mark.integration
     async def test_real_token_client_creation(self, real_auth_client):
         """Test client creation with real Fastmail token."""
-        async with real_auth_client:
-            client = real_auth_client.get_client()
-            assert isinstance(client, Client)
+        client = real_auth_client.get_client()
+        assert isinstance(client, Client)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     @pytest.mark.integration
     async def test_real_get_valid_token(self, real_auth_client):
         """Test getting valid token with real Fastmail token."""
-        async with real_auth_client:
-            token = await real_auth_client.get_valid_token()
-            assert token is not None
-            assert len(token) > 0
+        token = await real_auth_client.get_valid_token()
+        assert token is not None
+        assert len(token) > 0
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     @pytest.mark.integration
     async def test_real_jmapc_basic_request(self, real_auth_client):
         """Test making a basic jmapc request with real token."""
         from jmapc.methods import MailboxQuery, MailboxGet
         from jmapc import Ref
 
-        async with real_auth_client:
-            client = real_auth_client.get_client()
-
-            # Make a real request using jmapc following the examples pattern
-            try:
-                results = client.request(
-                    [
-                        MailboxQuery(),  # Query all mailboxes
-                        MailboxGet(
-                            ids=Ref("/ids")
-                        ),  # Get details using result reference
-                    ]
-                )
-                assert len(results) == 2
-                assert results[1].response is not None
-                print(
-                    f"Successfully retrieved {len(results[1].response.data)} mailboxes"
-                )
-            except Exception as e:
-                pytest.fail(f"Real jmapc request failed: {e}")
+        client = real_auth_client.get_client()
+
+        # Make a real request using jmapc following the examples pattern
+        try:
+            results = client.request(
+                [
+                    MailboxQuery(),  # Query all mailboxes
+                    MailboxGet(ids=Ref("/ids")),  # Get details using result reference
+                ]
+            )
+            assert len(results) == 2
+            assert results[1].response is not None
+            print(f"Successfully retrieved {len(results[1].response.data)} mailboxes")
+        except Exception as e:
+            pytest.fail(f"Real jmapc request failed: {e}")
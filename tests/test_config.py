@@ -1,48 +1,41 @@
-import os
+from functools import lru_cache
+
 import pytest
-from unittest.mock import patch
 
 from jmap_mcp.config import Config, FastmailConfig, MCPConfig, load_config
 
+# Every environment variable load_config reads
+_JMAP_KEYS = (
+    "FASTMAIL_AUTH_TOKEN",
+    "FASTMAIL_JMAP_BASE_URL",
+    "JMAP_API_TOKEN",
+    "JMAP_HOST",
+    "MCP_HOST",
+    "MCP_PORT",
+    "LOG_LEVEL",
+    "LOG_FILE",
+)
 
-class TestConfig:
-    """Test configuration loading and validation."""
-
-    def test_fastmail_config_validation(self):
-        """Test Fastmail configuration validation."""
-        config = FastmailConfig(auth_token="test_auth_token")
-
-        assert config.auth_token == "test_auth_token"
-        assert config.jmap_base_url == "https://api.fastmail.com/jmap/api/"
-
-    def test_mcp_config_defaults(self):
-        """Test MCP configuration defaults."""
-        config = MCPConfig()
 
-        assert config.host == "localhost"
-        assert config.port == 3000
+_DEFAULT_URL = "https://api.fastmail.com/jmap/api/"
 
-    @patch.dict(
-        os.environ,
+# (environment, auth_token, jmap_base_url, mcp host, mcp port, log_level)
+_ENV_CASES = [
+    pytest.param(
         {
             "FASTMAIL_AUTH_TOKEN": "env_auth_token",
             "MCP_HOST": "0.0.0.0",
             "MCP_PORT": "8080",
             "LOG_LEVEL": "DEBUG",
         },
-        clear=True,
-    )
-    def test_load_config_from_env_our_format(self):
-        """Test loading configuration from environment variables (our format)."""
-        config = load_config()
-
-        assert config.fastmail.auth_token == "env_auth_token"
-        assert config.mcp.host == "0.0.0.0"
-        assert config.mcp.port == 8080
-        assert config.log_level == "DEBUG"
-
-    @patch.dict(
-        os.environ,
+        "env_auth_token",
+        _DEFAULT_URL,
+        "0.0.0.0",
+        8080,
+        "DEBUG",
+        id="our_format",
+    ),
+    pytest.param(
         {
             "JMAP_API_TOKEN": "jmapc_auth_token",
             "JMAP_HOST": "api.fastmail.com",
@@ -50,81 +43,145 @@ class TestConfig:
             "MCP_PORT": "9000",
             "LOG_LEVEL": "WARNING",
         },
-        clear=True,
-    )
-    def test_load_config_from_env_jmapc_format(self):
-        """Test loading configuration from environment variables (jmapc format)."""
-        config = load_config()
-
-        assert config.fastmail.auth_token == "jmapc_auth_token"
-        assert config.fastmail.jmap_base_url == "https://api.fastmail.com/jmap/api/"
-        assert config.mcp.host == "127.0.0.1"
-        assert config.mcp.port == 9000
-        assert config.log_level == "WARNING"
-
-    @patch.dict(
-        os.environ,
+        "jmapc_auth_token",
+        _DEFAULT_URL,
+        "127.0.0.1",
+        9000,
+        "WARNING",
+        id="jmapc_format",
+    ),
+    # Our token takes precedence, but the jmapc host is still used
+    pytest.param(
         {
             "FASTMAIL_AUTH_TOKEN": "our_token",
             "JMAP_API_TOKEN": "jmapc_token",
             "JMAP_HOST": "custom.host.com",
         },
-        clear=True,
-    )
-    def test_load_config_precedence(self):
-        """Test that our format takes precedence over jmapc format."""
-        config = load_config()
-
-        # Our token should take precedence
-        assert config.fastmail.auth_token == "our_token"
-        # But jmapc host should still be used
-        assert config.fastmail.jmap_base_url == "https://custom.host.com/jmap/api/"
-
-    @patch.dict(
-        os.environ,
+        "our_token",
+        "https://custom.host.com/jmap/api/",
+        "localhost",
+        3000,
+        "INFO",
+        id="precedence",
+    ),
+    pytest.param(
         {
             "FASTMAIL_JMAP_BASE_URL": "https://custom.example.com/jmap/",
             "JMAP_API_TOKEN": "test_token",
         },
-        clear=True,
-    )
-    def test_load_config_custom_base_url(self):
-        """Test loading with custom JMAP base URL."""
-        config = load_config()
+        "test_token",
+        "https://custom.example.com/jmap/",
+        "localhost",
+        3000,
+        "INFO",
+        id="custom_base_url",
+    ),
+    # JMAP_HOST gets converted to a full URL
+    pytest.param(
+        {"JMAP_HOST": "custom.host.example.com", "JMAP_API_TOKEN": "test_token"},
+        "test_token",
+        "https://custom.host.example.com/jmap/api/",
+        "localhost",
+        3000,
+        "INFO",
+        id="jmap_host_url",
+    ),
+    # A trailing slash is added to base URLs
+    pytest.param(
+        {
+            "FASTMAIL_JMAP_BASE_URL": "https://example.com/jmap",
+            "JMAP_API_TOKEN": "test_token",
+        },
+        "test_token",
+        "https://example.com/jmap/",
+        "localhost",
+        3000,
+        "INFO",
+        id="trailing_slash",
+    ),
+    pytest.param({}, "", _DEFAULT_URL, "localhost", 3000, "INFO", id="empty_env"),
+]
 
-        assert config.fastmail.auth_token == "test_token"
-        assert config.fastmail.jmap_base_url == "https://custom.example.com/jmap/"
 
-    @patch.dict(
-        os.environ,
-        {"JMAP_HOST": "custom.host.example.com", "JMAP_API_TOKEN": "test_token"},
-        clear=True,
-    )
-    def test_jmap_host_url_conversion(self):
-        """Test that JMAP_HOST gets converted to full URL."""
-        config = load_config()
+@lru_cache(maxsize=None)
+def _cached_load(env_items: tuple) -> Config:
+    """Load config once per distinct environment."""
+    with pytest.MonkeyPatch.context() as mp:
+        for key in _JMAP_KEYS:
+            mp.delenv(key, raising=False)
+        for key, value in env_items:
+            mp.setenv(key, value)
+        return load_config()
+
 
+@pytest.fixture(autouse=True)
+def clean_jmap_env(monkeypatch):
+    """Unset the config variables so the host environment cannot leak in."""
+    for key in _JMAP_KEYS:
+        monkeypatch.delenv(key, raising=False)
+
+
+@pytest.fixture(scope="session")
+def loaded_config(request):
+    """Config loaded from the environment given as the indirect parameter."""
+    return _cached_load(tuple(sorted(request.param.items())))
+
+
+class TestConfig:
+    """Test configuration loading and validation."""
+
+    def test_fastmail_config_validation(self):
+        """Test Fastmail configuration validation."""
+        config = FastmailConfig(auth_token="test_auth_token")
+
+        assert config.auth_token == "test_auth_token"
+        assert config.jmap_base_url == "https://api.fastmail.com/jmap/api/"
+
+    def test_fastmail_config_jmap_host(self):
+        """Test JMAP host extraction from the base URL."""
+        assert FastmailConfig(auth_token="t").jmap_host == "api.fastmail.com"
+        assert (
+            FastmailConfig(auth_token="t", jmap_base_url="api.fastmail.com").jmap_host
+            == "api.fastmail.com"
+        )
+        assert (
+            FastmailConfig(
+                auth_token="t", jmap_base_url="https://custom.host.com/path"
+            ).jmap_host
+            == "custom.host.com"
+        )
         assert (
-            config.fastmail.jmap_base_url == "https://custom.host.example.com/jmap/api/"
+            FastmailConfig(
+                auth_token="t", jmap_base_url="https://localhost:8443/jmap/"
+            ).jmap_host
+            == "localhost:8443"
         )
 
-    @patch.dict(
-        os.environ,
-        {
-            "FASTMAIL_JMAP_BASE_URL": "https://example.com/jmap",  # No trailing slash
-            "JMAP_API_TOKEN": "test_token",
-        },
-        clear=True,
-    )
-    def test_url_trailing_slash_added(self):
-        """Test that trailing slash is added to URLs."""
-        config = load_config()
+    def test_mcp_config_defaults(self):
+        """Test MCP configuration defaults."""
+        config = MCPConfig()
 
-        assert config.fastmail.jmap_base_url == "https://example.com/jmap/"
+        assert config.host == "localhost"
+        assert config.port == 3000
+
+    @pytest.mark.parametrize(
+        "loaded_config,auth_token,base_url,host,port,log_level",
+        _ENV_CASES,
+        indirect=["loaded_config"],
+    )
+    def test_load_config(
+        self, loaded_config, auth_token, base_url, host, port, log_level
+    ):
+        """Test loading configuration from environment variables."""
+        assert loaded_config.fastmail.auth_token == auth_token
+        assert loaded_config.fastmail.jmap_base_url == base_url
+        assert loaded_config.mcp.host == host
+        assert loaded_config.mcp.port == port
+        assert loaded_config.log_level == log_level
 
     def test_config_validation_error(self):
         """Test configuration validation with missing required fields."""
-        with pytest.raises(ValueError):
+        with pytest.raises(TypeError, match="auth_token"):
             FastmailConfig()  # Missing auth_token
 
     def test_fastmail_config_with_custom_base_url(self):
@@ -135,15 +192,3 @@ class TestConfig:
 
         assert config.auth_token == "test_token"
         assert config.jmap_base_url == "https://custom.example.com/jmap/"
-
-    @patch.dict(os.environ, {}, clear=True)
-    def test_load_config_empty_env(self):
-        """Test loading config with empty environment."""
-        config = load_config()
-
-        # Should get empty auth token and default values
-        assert config.fastmail.auth_token == ""
-        assert config.fastmail.jmap_base_url == "https://api.fastmail.com/jmap/api/"
-        assert config.mcp.host == "localhost"
-        assert config.mcp.port == 3000
-        assert config.log_level == "INFO"
@@ -1,46 +1,105 @@
+import asyncio
 import os
+import threading
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import DEFAULT, patch, MagicMock
 
+from jmapc import Operator
 from jmapc.methods import (
     MailboxGetResponse,
     EmailQueryResponse,
     EmailGetResponse,
     MailboxQueryResponse,
+    MailboxChangesResponse,
+    IdentityGetResponse,
 )
 
-from jmap_mcp.jmap_client import JMAPClient, JMAPError
+from jmap_mcp.jmap_client import (
+    MAILBOX_CACHE_TTL,
+    MAILBOX_PROPERTIES,
+    MAX_CONCURRENT_REQUESTS,
+    JMAPClient,
+    JMAPError,
+)
 from jmap_mcp.config import FastmailConfig
 
 
+# jmapc response classes that tests build spec'd mocks for, by class name
+_RESPONSE_CLASSES = {
+    cls.__name__: cls
+    for cls in (
+        MailboxQueryResponse,
+        MailboxGetResponse,
+        MailboxChangesResponse,
+        EmailQueryResponse,
+        EmailGetResponse,
+        IdentityGetResponse,
+    )
+}
+
+
+@pytest.fixture
+def spec_mock():
+    """Factory returning a new mock spec'd on a jmapc response class."""
+
+    def make(name):
+        return MagicMock(spec=_RESPONSE_CLASSES[name])
+
+    return make
+
+
+@pytest.fixture(scope="class")
+def class_patches():
+    """Patch config and FastmailAuth once for every test in the class."""
+    with patch.multiple(
+        "jmap_mcp.jmap_client", config=DEFAULT, FastmailAuth=DEFAULT
+    ) as mocks:
+        mocks["config"].fastmail = FastmailConfig(
+            auth_token="test_token_123",
+            jmap_base_url="https://api.fastmail.com/jmap/api/",
+        )
+        yield mocks
+
+
 class TestJMAPClient:
     """Test JMAPClient functionality."""
 
     @pytest.fixture
-    def mock_config(self):
+    def mock_config(self, class_patches):
         """Mock configuration for testing."""
-        with patch("jmap_mcp.jmap_client.config") as mock_config:
-            mock_config.fastmail = FastmailConfig(
-                auth_token="test_token_123",
-                jmap_base_url="https://api.fastmail.com/jmap/api/",
-            )
-            yield mock_config
+        return class_patches["config"]
 
     @pytest.fixture
-    def mock_auth(self):
-        """Mock FastmailAuth for testing."""
-        with patch("jmap_mcp.jmap_client.FastmailAuth") as mock_auth_class:
-            mock_auth = MagicMock()
-            mock_client = MagicMock()
-            mock_auth.get_client.return_value = mock_client
-            mock_auth_class.return_value = mock_auth
-            yield mock_auth, mock_client
+    def mock_auth(self, class_patches):
+        """Mock FastmailAuth for testing, with a fresh instance per test."""
+        mock_auth_class = class_patches["FastmailAuth"]
+        mock_auth_class.reset_mock()
+        mock_auth = MagicMock()
+        mock_client = MagicMock()
+        mock_auth.get_client.return_value = mock_client
+        mock_auth_class.return_value = mock_auth
+        return mock_auth, mock_client
 
     @pytest.fixture
     def jmap_client(self, mock_config, mock_auth):
         """JMAPClient instance for testing."""
         return JMAPClient()
 
+    @pytest.fixture
+    def mock_client(self, mock_auth):
+        """The jmapc client mock handed out by the mocked FastmailAuth."""
+        return mock_auth[1]
+
+    @pytest.fixture
+    def connected_client(self, jmap_client, mock_client):
+        """JMAPClient already holding the mock jmapc client."""
+        jmap_client._client = mock_client
+        return jmap_client
+
     def test_init(self, jmap_client):
         """Test JMAPClient initialization."""
         assert jmap_client._auth is not None
@@ -58,27 +117,24 @@ class TestJMAPClient:
         mock_auth_instance.__aexit__.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_get_mailboxes_success(self, jmap_client, mock_auth):
+    async def test_get_mailboxes_success(
+        self, connected_client, mock_client, spec_mock
+    ):
         """Test successful mailbox retrieval."""
-        mock_auth_instance, mock_client = mock_auth
-        jmap_client._client = mock_client
-
         # Create mock mailbox data
-        mock_mailbox = MagicMock()
-        mock_mailbox.id = "mb1"
-        mock_mailbox.name = "Inbox"
-        mock_mailbox.role = "inbox"
-        mock_mailbox.total_emails = 42
-        mock_mailbox.unread_emails = 5
+        mock_mailbox = SimpleNamespace(
+            id="mb1", name="Inbox", role="inbox", total_emails=42, unread_emails=5
+        )
 
         # Create mock query response (first method)
-        mock_query_response = MagicMock(spec=MailboxQueryResponse)
+        mock_query_response = spec_mock("MailboxQueryResponse")
         mock_query_response.ids = ["mb1"]
         mock_query_invocation = MagicMock()
         mock_query_invocation.response = mock_query_response
 
         # Create mock get response (second method)
-        mock_get_response = MagicMock(spec=MailboxGetResponse)
+        mock_get_response = spec_mock("MailboxGetResponse")
+        mock_get_response.state = "state1"
         mock_get_response.data = [mock_mailbox]
         mock_get_invocation = MagicMock()
         mock_get_invocation.response = mock_get_response
@@ -86,7 +142,7 @@ class TestJMAPClient:
         # Return both responses
         mock_client.request.return_value = [mock_query_invocation, mock_get_invocation]
 
-        result = await jmap_client.get_mailboxes()
+        result = await connected_client.get_mailboxes()
 
         assert len(result) == 1
         assert result[0]["id"] == "mb1"
@@ -95,6 +151,61 @@ class TestJMAPClient:
         assert result[0]["totalEmails"] == 42
         assert result[0]["unreadEmails"] == 5
 
+        mailbox_get = mock_client.request.call_args[0][0][1]
+        assert mailbox_get.properties == MAILBOX_PROPERTIES
+
+        cache = await connected_client.get_mailbox_cache()
+        assert cache.find("INBOX") is result[0]
+        assert cache.find("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_get_mailboxes_cached(self, connected_client, mock_client, spec_mock):
+        """Test that mailboxes are reused while the server state is unchanged."""
+        mock_mailbox = SimpleNamespace(
+            id="mb1", name="Inbox", role="inbox", total_emails=1, unread_emails=0
+        )
+        mock_get_response = spec_mock("MailboxGetResponse")
+        mock_get_response.state = "state1"
+        mock_get_response.data = [mock_mailbox]
+        mock_client.request.return_value = [
+            MagicMock(response=spec_mock("MailboxQueryResponse")),
+            MagicMock(response=mock_get_response),
+        ]
+
+        first = await connected_client.get_mailboxes()
+        assert await connected_client.get_mailboxes() is first
+        assert mock_client.request.call_count == 1
+
+        # Once stale, a Mailbox/changes with no new state keeps the cache
+        connected_client._mailboxes.checked_at -= MAILBOX_CACHE_TTL
+        mock_changes = spec_mock("MailboxChangesResponse")
+        mock_changes.new_state = "state1"
+        mock_client.request.return_value = [MagicMock(response=mock_changes)]
+
+        assert await connected_client.get_mailboxes() is first
+        assert mock_client.request.call_count == 2
+        assert connected_client._mailboxes.is_fresh()
+
+    @pytest.mark.asyncio
+    async def test_get_mailboxes_concurrent(
+        self, connected_client, mock_client, spec_mock
+    ):
+        """Test that concurrent callers share a single mailbox fetch."""
+        mock_get_response = spec_mock("MailboxGetResponse")
+        mock_get_response.state = "state1"
+        mock_get_response.data = []
+        mock_client.request.return_value = [
+            MagicMock(response=spec_mock("MailboxQueryResponse")),
+            MagicMock(response=mock_get_response),
+        ]
+
+        caches = await asyncio.gather(
+            *(connected_client.get_mailbox_cache() for _ in range(3))
+        )
+
+        assert mock_client.request.call_count == 1
+        assert all(cache is caches[0] for cache in caches)
+
     @pytest.mark.asyncio
     async def test_get_mailboxes_not_initialized(self, jmap_client):
         """Test mailbox retrieval when client not initialized."""
@@ -103,13 +214,28 @@ class TestJMAPClient:
         assert "Client not initialized" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_search_emails_success(self, jmap_client, mock_auth):
-        """Test successful email search."""
+    async def test_request_session_cache(self, connected_client, mock_auth):
+        """Test that requests persist the session and drop it on 401."""
         mock_auth_instance, mock_client = mock_auth
-        jmap_client._client = mock_client
 
+        await connected_client._request([])
+        mock_auth_instance.save_session.assert_called_once()
+
+        unauthorized = Exception("401 Unauthorized")
+        unauthorized.response = MagicMock(status_code=401)
+        mock_client.request.side_effect = unauthorized
+
+        with pytest.raises(Exception):
+            await connected_client._request([])
+        mock_auth_instance.invalidate_session.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_search_emails_success(
+        self, connected_client, mock_client, spec_mock
+    ):
+        """Test successful email search."""
         # Create mock response
-        mock_response = MagicMock(spec=EmailQueryResponse)
+        mock_response = spec_mock("EmailQueryResponse")
         mock_response.ids = ["email1", "email2"]
         mock_response.total = 2
         mock_response.limit = 50
@@ -121,7 +247,7 @@ class TestJMAPClient:
 
         mock_client.request.return_value = [mock_invocation]
 
-        result = await jmap_client.search_emails(
+        result = await connected_client.search_emails(
             filter_conditions={"text": "test"}, limit=10
         )
 
@@ -131,25 +257,90 @@ class TestJMAPClient:
         assert result["position"] == 0
 
     @pytest.mark.asyncio
-    async def test_get_emails_success(self, jmap_client, mock_auth):
-        """Test successful email retrieval."""
-        mock_auth_instance, mock_client = mock_auth
-        jmap_client._client = mock_client
+    async def test_search_emails_filter_pushdown(self, connected_client, mock_client):
+        """Test that all filter conditions are sent to the server."""
+        mock_invocation = MagicMock()
+        mock_client.request.return_value = [mock_invocation]
+
+        await connected_client.search_emails(
+            filter_conditions={
+                "from": "sender@example.com",
+                "subject": "invoice",
+                "after": "2024-01-01T00:00:00+00:00",
+                "has_attachment": True,
+                "not_keyword": "$seen",
+            },
+            mailbox_id="mb1",
+        )
+
+        email_filter = mock_client.request.call_args[0][0][0].filter
+        assert email_filter.in_mailbox == "mb1"
+        assert email_filter.mail_from == "sender@example.com"
+        assert email_filter.header == ["Subject", "invoice"]
+        assert email_filter.after == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert email_filter.has_attachment is True
+        assert email_filter.not_keyword == "$seen"
 
+    @pytest.mark.asyncio
+    async def test_search_emails_subject_and_header(
+        self, connected_client, mock_client
+    ):
+        """Test that a subject and a header filter are both applied."""
+        mock_client.request.return_value = [MagicMock()]
+
+        await connected_client.search_emails(
+            filter_conditions={"subject": "invoice", "header": ["X-Spam", "no"]}
+        )
+
+        email_filter = mock_client.request.call_args[0][0][0].filter
+        assert email_filter.operator == Operator.AND
+        assert [c.header for c in email_filter.conditions] == [
+            ["X-Spam", "no"],
+            ["Subject", "invoice"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search_and_fetch(self, connected_client, mock_client, spec_mock):
+        """Test that search and fetch share one request via a back-reference."""
+        mock_email = MagicMock(id="email1", mail_from=None, to=None, cc=None, bcc=None)
+        mock_get_response = spec_mock("EmailGetResponse")
+        mock_get_response.data = [mock_email]
+        mock_client.request.return_value = [
+            MagicMock(response=MagicMock()),
+            MagicMock(response=mock_get_response),
+        ]
+
+        result = await connected_client.search_and_fetch(
+            filter_conditions={"text": "hello"}, limit=10
+        )
+
+        assert [email["id"] for email in result] == ["email1"]
+        mock_client.request.assert_called_once()
+        email_query, email_get = mock_client.request.call_args[0][0]
+        assert email_query.limit == 10
+        assert email_get.ids.path == "/ids"
+
+    @pytest.mark.asyncio
+    async def test_get_emails_success(self, connected_client, mock_client, spec_mock):
+        """Test successful email retrieval."""
         # Create mock email data
         mock_email = MagicMock()
         mock_email.id = "email1"
         mock_email.subject = "Test Subject"
-        mock_email.mail_from = [MagicMock(email="sender@example.com", name="Sender")]
-        mock_email.to = [MagicMock(email="recipient@example.com", name="Recipient")]
+        mock_email.mail_from = [
+            SimpleNamespace(email="sender@example.com", name="Sender")
+        ]
+        mock_email.to = [SimpleNamespace(email="recipient@example.com", name=None)]
         mock_email.cc = None
         mock_email.bcc = None
         mock_email.received_at = None
+        mock_email.sent_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
         mock_email.size = 1024
         mock_email.preview = "Email preview"
+        mock_email.keywords = {"$seen": True}
 
         # Create mock response
-        mock_response = MagicMock(spec=EmailGetResponse)
+        mock_response = spec_mock("EmailGetResponse")
         mock_response.data = [mock_email]
 
         # Create mock invocation response without an error attribute
@@ -159,38 +350,103 @@ class TestJMAPClient:
 
         mock_client.request.return_value = [mock_invocation]
 
-        result = await jmap_client.get_emails(["email1"])
+        result = await connected_client.get_emails(["email1"])
 
         assert len(result) == 1
         assert result[0]["id"] == "email1"
         assert result[0]["subject"] == "Test Subject"
-        assert result[0]["from"][0]["email"] == "sender@example.com"
-        assert result[0]["to"][0]["email"] == "recipient@example.com"
+        assert result[0]["from"][0] == {"email": "sender@example.com", "name": "Sender"}
+        assert result[0]["to"][0] == {"email": "recipient@example.com", "name": ""}
+        assert result[0]["keywords"] == {"$seen": True}
+        # Properties outside the listing defaults are not fetched or emitted
+        assert "sentAt" not in result[0]
+        assert "cc" not in result[0]
+        email_get = mock_client.request.call_args[0][0][0]
+        assert "textBody" not in email_get.properties
+
+        result = await connected_client.get_emails(
+            ["email1"], properties=["id", "sentAt", "cc"]
+        )
+        assert result[0] == {
+            "id": "email1",
+            "sentAt": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            "cc": [],
+        }
 
     @pytest.mark.asyncio
-    async def test_create_draft_not_implemented(self, jmap_client, mock_auth):
-        """Test that create_draft is properly implemented."""
-        mock_auth_instance, mock_client = mock_auth
-        jmap_client._client = mock_client
+    async def test_get_emails_chunked(self, connected_client, mock_client, spec_mock):
+        """Test that large id lists are fetched in chunks, in order."""
 
-        # Mock the mailbox query for Drafts
-        mock_mailbox = MagicMock()
-        mock_mailbox.id = "drafts_id"
+        def request(calls):
+            mock_response = spec_mock("EmailGetResponse")
+            mock_response.data = [
+                MagicMock(id=email_id, mail_from=None, to=None, cc=None, bcc=None)
+                for email_id in calls[0].ids
+            ]
+            return [MagicMock(response=mock_response)]
+
+        mock_client.request.side_effect = request
+
+        ids = [f"email{i}" for i in range(120)]
+        result = await connected_client.get_emails(ids)
+
+        assert mock_client.request.call_count == 3
+        assert [email["id"] for email in result] == ids
+
+    @pytest.mark.asyncio
+    async def test_requests_bounded_across_calls(
+        self, connected_client, mock_client, spec_mock
+    ):
+        """Test that concurrent calls share one in-flight request limit."""
+        in_flight = 0
+        peak = 0
+        counter_lock = threading.Lock()
+
+        def request(calls):
+            nonlocal in_flight, peak
+            with counter_lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with counter_lock:
+                in_flight -= 1
+            mock_response = spec_mock("EmailGetResponse")
+            mock_response.data = []
+            return [MagicMock(response=mock_response)]
+
+        mock_client.request.side_effect = request
+
+        ids = [f"email{i}" for i in range(100)]
+        await asyncio.gather(*(connected_client.get_emails(ids) for _ in range(4)))
+
+        assert mock_client.request.call_count == 8
+        assert peak <= MAX_CONCURRENT_REQUESTS
+
+    @pytest.mark.asyncio
+    async def test_empty_requests_skip_network(self, connected_client, mock_client):
+        """Test that empty id lists and zero limits make no request."""
+        assert await connected_client.get_emails([]) == []
+        result = await connected_client.search_emails(limit=0)
+
+        assert result["ids"] == []
+        mock_client.request.assert_not_called()
 
-        mock_mailbox_response = MagicMock(spec=MailboxGetResponse)
-        mock_mailbox_response.data = [mock_mailbox]
+    @pytest.mark.asyncio
+    async def test_create_draft_not_implemented(
+        self, connected_client, mock_client, spec_mock
+    ):
+        """Test that create_draft is properly implemented."""
+        # Mock the mailbox query for Drafts
+        mock_mailbox_response = spec_mock("MailboxQueryResponse")
+        mock_mailbox_response.ids = ["drafts_id"]
 
         mock_mailbox_invocation = MagicMock()
         mock_mailbox_invocation.response = mock_mailbox_response
 
         # Mock identity get
-        mock_identity = MagicMock()
-        mock_identity.email = "user@example.com"
-        mock_identity.name = "User"
-
-        from jmapc.methods import IdentityGetResponse
+        mock_identity = SimpleNamespace(email="user@example.com", name="User")
 
-        mock_identity_response = MagicMock(spec=IdentityGetResponse)
+        mock_identity_response = spec_mock("IdentityGetResponse")
         mock_identity_response.data = [mock_identity]
 
         mock_identity_invocation = MagicMock()
@@ -208,18 +464,75 @@ class TestJMAPClient:
 
         # Set up the client to return different responses for different calls
         mock_client.request.side_effect = [
-            [mock_mailbox_invocation, mock_mailbox_invocation],  # Drafts mailbox query
-            [mock_identity_invocation],  # Identity get
+            [mock_mailbox_invocation, mock_identity_invocation],  # Drafts + identity
             [mock_email_set_invocation],  # Email creation
+            [mock_email_set_invocation],  # Second email creation
         ]
 
-        result = await jmap_client.create_draft(
+        result = await connected_client.create_draft(
             subject="Test Subject",
             to_addresses=[{"email": "recipient@example.com", "name": "Recipient"}],
             text_body="Test body",
         )
 
         assert result == "draft_email_id"
+        draft = mock_client.request.call_args[0][0][0].create["draft"]
+        assert draft.mailbox_ids == {"drafts_id": True}
+        assert draft.mail_from[0].email == "user@example.com"
+
+        # Drafts mailbox and identity are cached for subsequent drafts
+        await connected_client.create_draft(
+            subject="Another Subject",
+            to_addresses=[{"email": "recipient@example.com"}],
+        )
+        assert mock_client.request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_send_email_success(self, connected_client, mock_client, spec_mock):
+        """Test sending a draft lets the server derive the envelope."""
+        mock_identity = SimpleNamespace(id="identity1")
+
+        mock_identity_response = spec_mock("IdentityGetResponse")
+        mock_identity_response.data = [mock_identity]
+
+        mock_identity_invocation = MagicMock()
+        mock_identity_invocation.response = mock_identity_response
+
+        mock_submission_invocation = MagicMock()
+        mock_submission_invocation.response.created = {"send": MagicMock()}
+
+        mock_client.request.side_effect = [
+            [mock_identity_invocation],  # Identity get
+            [mock_submission_invocation],  # Email submission
+        ]
+
+        result = await connected_client.send_email("draft_email_id")
+
+        assert result
+        assert mock_client.request.call_count == 2
+        submission = mock_client.request.call_args[0][0][0].create["send"]
+        assert submission.email_id == "draft_email_id"
+        assert submission.identity_id == "identity1"
+        assert submission.envelope is None
+
+    @pytest.mark.asyncio
+    async def test_send_email_uses_cached_identity(self, connected_client, mock_client):
+        """Test sending reuses the cached identity and drops it on failure."""
+        connected_client._identity = SimpleNamespace(id="identity1")
+
+        mock_submission_invocation = MagicMock()
+        mock_submission_invocation.response.created = {"send": MagicMock()}
+        mock_client.request.side_effect = [
+            [mock_submission_invocation],
+            Exception("identity not found"),
+        ]
+
+        assert await connected_client.send_email("draft_email_id")
+        assert mock_client.request.call_count == 1
+
+        with pytest.raises(JMAPError):
+            await connected_client.send_email("draft_email_id")
+        assert connected_client._identity is None
 
 
 class TestJMAPClientIntegration:
@@ -0,0 +1,63 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from dateutil.tz import tzoffset, tzutc
+
+from jmap_mcp import mcp_server
+
+
+@pytest.fixture
+def mock_client():
+    """Patch JMAPClient so the server's shared client is a mock."""
+    client = MagicMock()
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+    client.get_mailbox_cache = AsyncMock()
+    with patch("jmap_mcp.jmap_client.JMAPClient", return_value=client):
+        yield client
+
+
+class TestLifespan:
+    """Test the server lifespan hook."""
+
+    @pytest.mark.asyncio
+    async def test_lifespan_warms_and_closes_client(self, mock_client):
+        """Test the shared client is connected on startup and closed on exit."""
+        async with mcp_server._lifespan(mcp_server.mcp):
+
+            async def warmed():
+                while not mock_client.get_mailbox_cache.await_count:
+                    await asyncio.sleep(0.01)
+
+            await asyncio.wait_for(warmed(), timeout=5)
+            assert mcp_server._client is mock_client
+            mock_client.__aenter__.assert_awaited_once()
+
+        mock_client.__aexit__.assert_awaited_once()
+        assert mcp_server._client is None
+
+
+class TestReadEmail:
+    """Test read_email rendering."""
+
+    @pytest.mark.asyncio
+    async def test_read_email_sent_at_offset(self, mock_client):
+        """Test a sentAt with the sender's offset is shown in UTC."""
+        mock_client.get_emails = AsyncMock(
+            return_value=[
+                {
+                    "id": "email1",
+                    "subject": "Hello",
+                    "keywords": {"$seen": True},
+                    "receivedAt": datetime(2024, 1, 1, 9, 30, tzinfo=tzutc()),
+                    "sentAt": datetime(2024, 1, 1, 11, 0, tzinfo=tzoffset(None, 7200)),
+                }
+            ]
+        )
+        with patch.object(mcp_server, "_client", mock_client):
+            result = await mcp_server.read_email("email1")
+
+        assert "**Received:** 2024-01-01 09:30:00 UTC\n" in result
+        assert "**Sent:** 2024-01-01 09:00:00 UTC\n" in result